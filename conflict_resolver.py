@@ -1,252 +1,275 @@
 # conflict_resolver.py - Conflict Detection and Resolution System
 from typing import Dict, List, Set, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import defaultdict
-import asyncio
+import sys
+import numpy as np
 
-@dataclass
+_DAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday')
+_TIME_SLOTS = (
+    "09:00-10:00", "10:00-11:00", "11:00-12:00", "12:00-13:00",
+    "14:00-15:00", "15:00-16:00", "16:00-17:00", "17:00-18:00"
+)
+
+# Conflict metadata per resource kind: type, id prefix, description, suggestions
+_CONFLICT_KINDS = {
+    'F': (
+        "faculty_overlap",
+        "faculty_conflict",
+        "Faculty {entity_id} has {count} classes at the same time",
+        (
+            "Reschedule one class to a different time slot",
+            "Assign alternative faculty member",
+            "Split class into multiple sections"
+        )
+    ),
+    'R': (
+        "room_booking",
+        "room_conflict",
+        "Room {entity_id} booked for {count} classes simultaneously",
+        (
+            "Move one class to available room",
+            "Reschedule to different time slot",
+            "Use online/hybrid mode for one class"
+        )
+    ),
+    'G': (
+        "student_clash",
+        "student_conflict",
+        "Student group {entity_id} has {count} classes at same time",
+        (
+            "Reschedule one class to different slot",
+            "Create additional section for elective",
+            "Move to asynchronous/online mode"
+        )
+    )
+}
+
+# Conflict id prefixes by conflict type, used when ids are rendered as strings
+_ID_PREFIXES = {conflict_type: id_prefix for conflict_type, id_prefix, _, _ in _CONFLICT_KINDS.values()}
+
+@dataclass(slots=True, frozen=True)
 class Conflict:
     """Represents a scheduling conflict"""
-    conflict_id: str
+    conflict_id: int
     conflict_type: str  # faculty_overlap, room_booking, student_clash, capacity_exceeded
     severity: str  # critical, high, medium, low
     description: str
-    affected_classes: List[Dict]
-    resolution_suggestions: List[str]
+    affected_classes: Tuple[Dict, ...] = field(compare=False)  # dicts are unhashable
+    resolution_suggestions: Tuple[str, ...]
     time_slot: str
     day: str
+    
+    @property
+    def conflict_id_str(self) -> str:
+        """String id for API output, e.g. faculty_conflict_3"""
+        return f"{_ID_PREFIXES.get(self.conflict_type, self.conflict_type)}_{self.conflict_id}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for API output and caching, with the string conflict id"""
+        return {
+            'conflict_id': self.conflict_id_str,
+            'conflict_type': self.conflict_type,
+            'severity': self.severity,
+            'description': self.description,
+            'affected_classes': list(self.affected_classes),
+            'resolution_suggestions': list(self.resolution_suggestions),
+            'time_slot': self.time_slot,
+            'day': self.day
+        }
 
 class ConflictResolver:
     """Detects and resolves scheduling conflicts"""
     
+    # Mock room table - would need actual room database
+    ROOMS = ('R101', 'R102', 'R103', 'L201', 'L202', 'L203')
+    ROOM_IDX = {room_id: idx for idx, room_id in enumerate(ROOMS)}
+    
     def __init__(self):
         self.conflicts = []
         self.conflict_count = 0
+        self._occ_fac: Dict[Tuple[str, str], Set[str]] = defaultdict(set)  # (day, time_slot) -> faculty ids
+        self._occ_grp: Dict[Tuple[str, str], Set[str]] = defaultdict(set)  # (day, time_slot) -> group ids
+        self._slot_conflicts: Dict[Tuple[str, str], List[Conflict]] = {}  # (day, time_slot) -> conflicts
+        self._dirty_slots: Set[Tuple[str, str]] = set()  # slots mutated since last detection
+        self._domains: Dict[int, Dict[Tuple[str, str], None]] = {}  # id(class) -> ordered free slots
+        self._neighbours: Dict[int, Set[int]] = {}  # id(class) -> classes sharing faculty/group
         
     async def resolve_conflicts(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
         """Main method to detect and resolve all conflicts"""
         
         # Detect all types of conflicts
-        conflicts = await self._detect_all_conflicts(schedule)
+        conflicts = self._detect_all_conflicts(schedule)
         
         # Attempt automatic resolution
         if conflicts:
             schedule = await self._auto_resolve_conflicts(schedule, conflicts)
             
-            # Re-check for remaining conflicts
-            remaining_conflicts = await self._detect_all_conflicts(schedule)
-            schedule['conflicts'] = remaining_conflicts
+            # Re-check only the slots touched during resolution
+            remaining_conflicts = self._redetect_dirty_conflicts(schedule)
+            # Conflicts leave the resolver as plain dicts with their string ids
+            schedule['conflicts'] = [conflict.to_dict() for conflict in remaining_conflicts]
         else:
             schedule['conflicts'] = []
         
         return schedule
     
-    async def _detect_all_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
+    def _detect_all_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
         """Detect all types of conflicts in the schedule"""
         
-        all_conflicts = []
-        
-        # Parallel conflict detection
-        tasks = [
-            self._detect_faculty_conflicts(schedule),
-            self._detect_room_conflicts(schedule),
-            self._detect_student_group_conflicts(schedule),
-            self._detect_capacity_conflicts(schedule)
-        ]
-        
-        results = await asyncio.gather(*tasks)
+        classes, conflict_index = self._build_conflict_index(schedule)
         
-        for conflict_list in results:
-            all_conflicts.extend(conflict_list)
+        self._slot_conflicts = self._group_slot_conflicts(classes, conflict_index)
+        self._dirty_slots = set()
         
-        return all_conflicts
+        return self._collect_conflicts()
     
-    async def _detect_faculty_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
-        """Detect faculty double-booking conflicts"""
-        
-        conflicts = []
-        faculty_schedule = defaultdict(list)
+    def _redetect_dirty_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
+        """Refresh cached conflicts for slots mutated since the last detection"""
         
-        # Build faculty schedule map
-        for day, day_schedule in schedule.get('weekly_schedule', {}).items():
-            for time_slot, classes in day_schedule.items():
-                if isinstance(classes, list):
-                    for class_info in classes:
-                        faculty_id = class_info.get('faculty_id')
-                        if faculty_id:
-                            faculty_schedule[faculty_id].append({
-                                'day': day,
-                                'time_slot': time_slot,
-                                'class_info': class_info
-                            })
-        
-        # Check for overlaps
-        for faculty_id, classes in faculty_schedule.items():
-            # Group by day and time
-            time_groups = defaultdict(list)
-            for class_entry in classes:
-                key = f"{class_entry['day']}_{class_entry['time_slot']}"
-                time_groups[key].append(class_entry)
+        if self._dirty_slots:
+            classes, conflict_index = self._build_conflict_index(schedule, self._dirty_slots)
             
-            # Find conflicts (more than one class at same time)
-            for time_key, class_list in time_groups.items():
-                if len(class_list) > 1:
-                    day, time_slot = time_key.split('_', 1)
-                    
-                    conflict = Conflict(
-                        conflict_id=f"faculty_conflict_{self.conflict_count}",
-                        conflict_type="faculty_overlap",
-                        severity="critical",
-                        description=f"Faculty {faculty_id} has {len(class_list)} classes at the same time",
-                        affected_classes=[c['class_info'] for c in class_list],
-                        resolution_suggestions=[
-                            "Reschedule one class to a different time slot",
-                            "Assign alternative faculty member",
-                            "Split class into multiple sections"
-                        ],
-                        time_slot=time_slot,
-                        day=day
-                    )
-                    conflicts.append(conflict)
-                    self.conflict_count += 1
-        
-        return conflicts
-    
-    async def _detect_room_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
-        """Detect room double-booking conflicts"""
-        
-        conflicts = []
-        room_schedule = defaultdict(list)
+            for slot_key in self._dirty_slots:
+                self._slot_conflicts.pop(slot_key, None)
+            self._slot_conflicts.update(self._group_slot_conflicts(classes, conflict_index))
+            self._dirty_slots = set()
         
-        # Build room schedule map
-        for day, day_schedule in schedule.get('weekly_schedule', {}).items():
-            for time_slot, classes in day_schedule.items():
-                if isinstance(classes, list):
-                    for class_info in classes:
-                        room_id = class_info.get('room_id')
-                        if room_id:
-                            room_schedule[room_id].append({
-                                'day': day,
-                                'time_slot': time_slot,
-                                'class_info': class_info
-                            })
-        
-        # Check for overlaps
-        for room_id, classes in room_schedule.items():
-            # Group by day and time
-            time_groups = defaultdict(list)
-            for class_entry in classes:
-                key = f"{class_entry['day']}_{class_entry['time_slot']}"
-                time_groups[key].append(class_entry)
-            
-            # Find conflicts
-            for time_key, class_list in time_groups.items():
-                if len(class_list) > 1:
-                    day, time_slot = time_key.split('_', 1)
-                    
-                    conflict = Conflict(
-                        conflict_id=f"room_conflict_{self.conflict_count}",
-                        conflict_type="room_booking",
-                        severity="critical",
-                        description=f"Room {room_id} booked for {len(class_list)} classes simultaneously",
-                        affected_classes=[c['class_info'] for c in class_list],
-                        resolution_suggestions=[
-                            "Move one class to available room",
-                            "Reschedule to different time slot",
-                            "Use online/hybrid mode for one class"
-                        ],
-                        time_slot=time_slot,
-                        day=day
-                    )
-                    conflicts.append(conflict)
-                    self.conflict_count += 1
-        
-        return conflicts
+        return self._collect_conflicts()
     
-    async def _detect_student_group_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
-        """Detect student group scheduling conflicts"""
+    def _collect_conflicts(self) -> List[Conflict]:
+        """Flatten cached per-slot conflicts"""
         
-        conflicts = []
-        group_schedule = defaultdict(list)
-        
-        # Build student group schedule map
-        for day, day_schedule in schedule.get('weekly_schedule', {}).items():
-            for time_slot, classes in day_schedule.items():
-                if isinstance(classes, list):
-                    for class_info in classes:
-                        group_id = class_info.get('group_id') or class_info.get('student_group_id')
-                        if group_id:
-                            group_schedule[group_id].append({
-                                'day': day,
-                                'time_slot': time_slot,
-                                'class_info': class_info
-                            })
-        
-        # Check for overlaps
-        for group_id, classes in group_schedule.items():
-            # Group by day and time
-            time_groups = defaultdict(list)
-            for class_entry in classes:
-                key = f"{class_entry['day']}_{class_entry['time_slot']}"
-                time_groups[key].append(class_entry)
-            
-            # Find conflicts
-            for time_key, class_list in time_groups.items():
-                if len(class_list) > 1:
-                    day, time_slot = time_key.split('_', 1)
-                    
-                    conflict = Conflict(
-                        conflict_id=f"student_conflict_{self.conflict_count}",
-                        conflict_type="student_clash",
-                        severity="critical",
-                        description=f"Student group {group_id} has {len(class_list)} classes at same time",
-                        affected_classes=[c['class_info'] for c in class_list],
-                        resolution_suggestions=[
-                            "Reschedule one class to different slot",
-                            "Create additional section for elective",
-                            "Move to asynchronous/online mode"
-                        ],
-                        time_slot=time_slot,
-                        day=day
-                    )
-                    conflicts.append(conflict)
-                    self.conflict_count += 1
-        
-        return conflicts
+        return [
+            conflict
+            for slot_conflicts in self._slot_conflicts.values()
+            for conflict in slot_conflicts
+        ]
     
-    async def _detect_capacity_conflicts(self, schedule: Dict[str, Any]) -> List[Conflict]:
-        """Detect room capacity vs student group size conflicts"""
-        
-        conflicts = []
-        
-        # This would need access to room capacities and group sizes
-        # Mock implementation for demonstration
+    def _group_slot_conflicts(
+        self,
+        classes: List[Dict],
+        conflict_index: Dict[Tuple, List[int]]
+    ) -> Dict[Tuple[str, str], List[Conflict]]:
+        """Create conflicts from the index, grouped by (day, time slot)"""
+        
+        slot_conflicts = defaultdict(list)
+        
+        # Two nodes sharing a resource bucket at the same slot conflict
+        for key, nodes in conflict_index.items():
+            if len(nodes) > 1:
+                _, _, day, time_slot = key
+                slot_conflicts[(day, time_slot)].append(
+                    self._make_conflict(key, [classes[node] for node in nodes])
+                )
+        
+        return slot_conflicts
+    
+    def _build_conflict_index(
+        self,
+        schedule: Dict[str, Any],
+        slots: Set[Tuple[str, str]] = None
+    ) -> Tuple[List[Dict], Dict[Tuple, List[int]]]:
+        """Bucket class nodes by (resource kind, resource id, day, time slot)"""
+        
+        classes = []
+        conflict_index = defaultdict(list)
+        weekly_schedule = schedule.get('weekly_schedule', {})
+        
+        # Index the whole week, or only the requested (day, time slot) cells.
+        # Interned keys make the repeated bucket lookups compare by pointer.
+        if slots is None:
+            cells = (
+                (sys.intern(day), sys.intern(time_slot), slot_classes)
+                for day, day_schedule in weekly_schedule.items()
+                for time_slot, slot_classes in day_schedule.items()
+            )
+        else:
+            cells = (
+                (sys.intern(day), sys.intern(time_slot), weekly_schedule.get(day, {}).get(time_slot))
+                for day, time_slot in slots
+            )
+        
+        for day, time_slot, slot_classes in cells:
+            if not isinstance(slot_classes, list):
+                continue
+            for class_info in slot_classes:
+                node = len(classes)
+                classes.append(class_info)
+                
+                faculty_id = class_info.get('faculty_id')
+                if faculty_id:
+                    conflict_index[('F', faculty_id, day, time_slot)].append(node)
+                
+                room_id = class_info.get('room_id')
+                if room_id:
+                    conflict_index[('R', room_id, day, time_slot)].append(node)
+                
+                group_id = class_info.get('group_id') or class_info.get('student_group_id')
+                if group_id:
+                    conflict_index[('G', group_id, day, time_slot)].append(node)
+        
+        return classes, conflict_index
+    
+    def _make_conflict(self, key: Tuple, affected_classes: List[Dict]) -> Conflict:
+        """Create a Conflict for a resource bucket holding several classes"""
+        
+        kind, entity_id, day, time_slot = key
+        conflict_type, _, description, suggestions = _CONFLICT_KINDS[kind]
+        
+        conflict = Conflict(
+            conflict_id=self.conflict_count,
+            conflict_type=conflict_type,
+            severity="critical",
+            description=description.format(entity_id=entity_id, count=len(affected_classes)),
+            affected_classes=tuple(affected_classes),
+            resolution_suggestions=suggestions,
+            time_slot=time_slot,
+            day=day
+        )
+        self.conflict_count += 1
         
-        return conflicts
+        return conflict
     
     async def _auto_resolve_conflicts(
         self,
         schedule: Dict[str, Any],
         conflicts: List[Conflict]
     ) -> Dict[str, Any]:
-        """Attempt to automatically resolve detected conflicts"""
+        """Attempt to automatically resolve detected conflicts (mutates schedule in place)"""
         
-        resolved_schedule = schedule.copy()
+        # Index occupied faculty/group slots once for fast availability checks
+        self._index_occupancy(schedule)
         
         # Sort conflicts by severity
         critical_conflicts = [c for c in conflicts if c.severity == "critical"]
         
+        # Prune candidate slots for every class that may be rescheduled
+        self._build_slot_domains([
+            c.affected_classes[-1] for c in critical_conflicts
+            if c.conflict_type in ("faculty_overlap", "student_clash") and len(c.affected_classes) > 1
+        ])
+        
+        # Forward checking: resolve the most constrained conflicts first
+        critical_conflicts.sort(key=self._remaining_slot_count)
+        
         for conflict in critical_conflicts:
             if conflict.conflict_type == "faculty_overlap":
-                resolved_schedule = await self._resolve_faculty_conflict(resolved_schedule, conflict)
+                await self._resolve_faculty_conflict(schedule, conflict)
             
             elif conflict.conflict_type == "room_booking":
-                resolved_schedule = await self._resolve_room_conflict(resolved_schedule, conflict)
+                await self._resolve_room_conflict(schedule, conflict)
             
             elif conflict.conflict_type == "student_clash":
-                resolved_schedule = await self._resolve_student_conflict(resolved_schedule, conflict)
+                await self._resolve_student_conflict(schedule, conflict)
+        
+        return schedule
+    
+    def _remaining_slot_count(self, conflict: Conflict) -> int:
+        """Number of candidate slots left for the class a conflict would move"""
         
-        return resolved_schedule
+        domain = self._domains.get(id(conflict.affected_classes[-1]))
+        return len(domain) if domain is not None else 0
     
     async def _resolve_faculty_conflict(
         self,
@@ -264,6 +287,11 @@ class ConflictResolver:
         # Try to move the lower priority class
         class_to_move = affected_classes[-1]  # Last class (assumed lower priority)
         
+        # Skip if an earlier resolution already moved this class
+        slot_classes = schedule['weekly_schedule'].get(conflict.day, {}).get(conflict.time_slot, [])
+        if not any(c is class_to_move for c in slot_classes):
+            return schedule
+        
         # Find available slot
         available_slot = self._find_available_slot(schedule, class_to_move)
         
@@ -274,6 +302,7 @@ class ConflictResolver:
             # Add to new slot
             new_day, new_time = available_slot
             self._add_class_to_schedule(schedule, new_day, new_time, class_to_move)
+            self._assign_domain_slot(class_to_move, available_slot)
         
         return schedule
     
@@ -304,6 +333,7 @@ class ConflictResolver:
             # Update room assignment
             class_to_reassign['room_id'] = alternative_room
             class_to_reassign['room_name'] = f"Room {alternative_room}"
+            self._dirty_slots.add((conflict.day, conflict.time_slot))
         
         return schedule
     
@@ -324,25 +354,86 @@ class ConflictResolver:
     ) -> Tuple[str, str]:
         """Find an available time slot for a class"""
         
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
-        time_slots = [
-            "09:00-10:00", "10:00-11:00", "11:00-12:00", "12:00-13:00",
-            "14:00-15:00", "15:00-16:00", "16:00-17:00", "17:00-18:00"
-        ]
+        domain = self._domains.get(id(class_info))
+        if domain:
+            return next(iter(domain))
+        
+        # No domain, or it was emptied by propagation: fall back to a full scan
+        return next(self._iter_available_slots(class_info), None)
+    
+    def _iter_available_slots(self, class_info: Dict):
+        """Yield free (day, time slot) pairs for a class in week order"""
         
         faculty_id = class_info.get('faculty_id')
         group_id = class_info.get('group_id') or class_info.get('student_group_id')
         
-        for day in days:
-            for time_slot in time_slots:
-                if self._is_slot_available(schedule, day, time_slot, faculty_id, group_id):
-                    return (day, time_slot)
+        for day in _DAYS:
+            for time_slot in _TIME_SLOTS:
+                if self._is_slot_available(day, time_slot, faculty_id, group_id):
+                    yield (day, time_slot)
+    
+    def _build_slot_domains(self, movable_classes: List[Dict]):
+        """Compute free-slot domains for movable classes and make them arc-consistent"""
+        
+        self._domains = {}
+        self._neighbours = defaultdict(set)
+        by_resource = defaultdict(list)
         
-        return None
+        for class_info in movable_classes:
+            key = id(class_info)
+            if key in self._domains:
+                continue
+            
+            # Ordered dict doubles as an ordered set of candidate slots
+            self._domains[key] = dict.fromkeys(self._iter_available_slots(class_info))
+            
+            faculty_id = class_info.get('faculty_id')
+            if faculty_id:
+                by_resource[('F', faculty_id)].append(key)
+            group_id = class_info.get('group_id') or class_info.get('student_group_id')
+            if group_id:
+                by_resource[('G', group_id)].append(key)
+        
+        # Classes sharing a faculty or group cannot take the same slot
+        for keys in by_resource.values():
+            for key in keys:
+                self._neighbours[key].update(k for k in keys if k != key)
+        
+        self._propagate_domains(list(self._domains))
+    
+    def _propagate_domains(self, worklist: List[int]):
+        """AC-3 revision: a class left with one slot removes it from its neighbours"""
+        
+        while worklist:
+            key = worklist.pop()
+            domain = self._domains.get(key)
+            if domain is None or len(domain) != 1:
+                continue
+            
+            slot = next(iter(domain))
+            for other in self._neighbours[key]:
+                other_domain = self._domains.get(other)
+                if other_domain is not None and slot in other_domain and len(other_domain) > 1:
+                    del other_domain[slot]
+                    worklist.append(other)
+    
+    def _assign_domain_slot(self, class_info: Dict, slot: Tuple[str, str]):
+        """Retire a placed class's domain and remove its slot from its neighbours"""
+        
+        key = id(class_info)
+        self._domains.pop(key, None)
+        
+        worklist = []
+        for other in self._neighbours.get(key, ()):
+            other_domain = self._domains.get(other)
+            if other_domain is not None and slot in other_domain:
+                del other_domain[slot]
+                worklist.append(other)
+        
+        self._propagate_domains(worklist)
     
     def _is_slot_available(
         self,
-        schedule: Dict[str, Any],
         day: str,
         time_slot: str,
         faculty_id: str,
@@ -350,30 +441,47 @@ class ConflictResolver:
     ) -> bool:
         """Check if a time slot is available for given faculty and group"""
         
-        day_schedule = schedule.get('weekly_schedule', {}).get(day, {})
-        slot_classes = day_schedule.get(time_slot, [])
+        slot_key = (day, time_slot)
+        return (faculty_id not in self._occ_fac.get(slot_key, ()) and
+                group_id not in self._occ_grp.get(slot_key, ()))
+    
+    def _index_occupancy(self, schedule: Dict[str, Any]):
+        """Record the faculty and groups occupying every (day, time slot)"""
         
-        if not isinstance(slot_classes, list):
-            slot_classes = [slot_classes] if slot_classes else []
+        self._occ_fac = defaultdict(set)
+        self._occ_grp = defaultdict(set)
         
-        for class_info in slot_classes:
-            if class_info.get('faculty_id') == faculty_id:
-                return False
-            if (class_info.get('group_id') == group_id or 
-                class_info.get('student_group_id') == group_id):
-                return False
+        for day, day_schedule in schedule.get('weekly_schedule', {}).items():
+            for time_slot, classes in day_schedule.items():
+                if not isinstance(classes, list):
+                    classes = [classes] if classes else []
+                for class_info in classes:
+                    self._mark_busy(class_info, day, time_slot)
+    
+    def _mark_busy(self, class_info: Dict, day: str, time_slot: str):
+        """Mark a class's faculty and group as occupied at a slot"""
+        
+        faculty_id = class_info.get('faculty_id')
+        if faculty_id:
+            self._occ_fac[(day, time_slot)].add(faculty_id)
         
-        return True
+        group_id = class_info.get('group_id') or class_info.get('student_group_id')
+        if group_id:
+            self._occ_grp[(day, time_slot)].add(group_id)
     
-    def _find_available_room(
-        self,
-        schedule: Dict[str, Any],
-        day: str,
-        time_slot: str,
-        room_type: str
-    ) -> str:
-        """Find an available room at given time"""
+    def _unmark_busy(self, class_info: Dict, day: str, time_slot: str, remaining: List[Dict]):
+        """Free a class's faculty and group at a slot unless another class still holds them"""
+        
+        faculty_id = class_info.get('faculty_id')
+        if faculty_id and not any(c.get('faculty_id') == faculty_id for c in remaining):
+            self._occ_fac[(day, time_slot)].discard(faculty_id)
         
+        group_id = class_info.get('group_id') or class_info.get('student_group_id')
+        if group_id and not any(
+            (c.get('group_id') or c.get('student_group_id')) == group_id for c in remaining
+        ):
+            self._occ_grp[(day, time_slot)].discard(group_id)
+    
     def _find_available_room(
         self,
         schedule: Dict[str, Any],
@@ -383,22 +491,25 @@ class ConflictResolver:
     ) -> str:
         """Find an available room at given time"""
         
-        # Mock implementation - would need actual room database
-        available_rooms = ['R101', 'R102', 'R103', 'L201', 'L202', 'L203']
-        
         day_schedule = schedule.get('weekly_schedule', {}).get(day, {})
         slot_classes = day_schedule.get(time_slot, [])
         
         if not isinstance(slot_classes, list):
             slot_classes = [slot_classes] if slot_classes else []
         
-        occupied_rooms = set(c.get('room_id') for c in slot_classes if c.get('room_id'))
+        # Occupancy bitmask over the fixed room table
+        occupied = 0
+        for class_info in slot_classes:
+            room_idx = self.ROOM_IDX.get(class_info.get('room_id'))
+            if room_idx is not None:
+                occupied |= 1 << room_idx
         
-        for room in available_rooms:
-            if room not in occupied_rooms:
-                return room
+        # Lowest set bit of the free mask is the first available room
+        free = ~occupied & ((1 << len(self.ROOMS)) - 1)
+        if not free:
+            return None
         
-        return None
+        return self.ROOMS[(free & -free).bit_length() - 1]
     
     def _remove_class_from_schedule(
         self,
@@ -413,9 +524,13 @@ class ConflictResolver:
         slot_classes = day_schedule.get(time_slot, [])
         
         if isinstance(slot_classes, list):
-            # Remove the specific class
-            updated_classes = [c for c in slot_classes if c != class_info]
-            schedule['weekly_schedule'][day][time_slot] = updated_classes
+            # Remove the specific class; conflicts hold the same dict objects
+            for i, c in enumerate(slot_classes):
+                if c is class_info:
+                    slot_classes.pop(i)
+                    self._unmark_busy(class_info, day, time_slot, slot_classes)
+                    self._dirty_slots.add((day, time_slot))
+                    break
     
     def _add_class_to_schedule(
         self,
@@ -426,37 +541,25 @@ class ConflictResolver:
     ):
         """Add a class to the schedule"""
         
-        if day not in schedule.get('weekly_schedule', {}):
-            schedule['weekly_schedule'][day] = {}
-        
-        if time_slot not in schedule['weekly_schedule'][day]:
-            schedule['weekly_schedule'][day][time_slot] = []
+        day_schedule = schedule.setdefault('weekly_schedule', {}).setdefault(day, {})
+        slot_classes = day_schedule.setdefault(time_slot, [])
         
-        if not isinstance(schedule['weekly_schedule'][day][time_slot], list):
-            schedule['weekly_schedule'][day][time_slot] = [schedule['weekly_schedule'][day][time_slot]]
+        if not isinstance(slot_classes, list):
+            slot_classes = [slot_classes] if slot_classes else []
+            day_schedule[time_slot] = slot_classes
         
-        schedule['weekly_schedule'][day][time_slot].append(class_info)
+        slot_classes.append(class_info)
+        self._mark_busy(class_info, day, time_slot)
+        self._dirty_slots.add((day, time_slot))
     
     def generate_conflict_heatmap(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
         """Generate conflict heatmap for visualization"""
         
         heatmap = {}
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+        day_counts = self._count_daily_clashes(schedule, _DAYS)
         
-        for day in days:
-            day_conflicts = 0
-            day_schedule = schedule.get('weekly_schedule', {}).get(day, {})
-            
-            for time_slot, classes in day_schedule.items():
-                if isinstance(classes, list) and len(classes) > 1:
-                    # Check for actual conflicts
-                    faculty_ids = [c.get('faculty_id') for c in classes if c.get('faculty_id')]
-                    room_ids = [c.get('room_id') for c in classes if c.get('room_id')]
-                    
-                    if len(faculty_ids) != len(set(faculty_ids)):
-                        day_conflicts += 1
-                    if len(room_ids) != len(set(room_ids)):
-                        day_conflicts += 1
+        for day_idx, day in enumerate(_DAYS):
+            day_conflicts = int(day_counts[day_idx])
             
             # Categorize conflict level
             if day_conflicts == 0:
@@ -471,4 +574,47 @@ class ConflictResolver:
                 "conflicts": day_conflicts
             }
         
-        return heatmap
\ No newline at end of file
+        return heatmap
+    
+    def _count_daily_clashes(self, schedule: Dict[str, Any], days: Tuple[str, ...]) -> np.ndarray:
+        """Count per day the slots holding a faculty clash and the slots holding a room clash"""
+        
+        weekly_schedule = schedule.get('weekly_schedule', {})
+        slot_codes = {}
+        id_codes = {}
+        rows = []
+        
+        # Pack classes into (day, slot, faculty, room) integer rows
+        for day_idx, day in enumerate(days):
+            for time_slot, classes in weekly_schedule.get(day, {}).items():
+                if not isinstance(classes, list) or len(classes) < 2:
+                    continue
+                slot_idx = slot_codes.setdefault(time_slot, len(slot_codes))
+                for class_info in classes:
+                    faculty_id = class_info.get('faculty_id')
+                    room_id = class_info.get('room_id')
+                    rows.append((
+                        day_idx,
+                        slot_idx,
+                        id_codes.setdefault(faculty_id, len(id_codes)) if faculty_id else -1,
+                        id_codes.setdefault(room_id, len(id_codes)) if room_id else -1
+                    ))
+        
+        if not rows:
+            return np.zeros(len(days), dtype=np.int64)
+        
+        arr = np.array(rows, dtype=np.int64)
+        cells = arr[:, 0] * len(slot_codes) + arr[:, 1]
+        
+        # Sort each resource column within its cell; equal neighbours are clashes
+        clashed_cells = []
+        for col in (2, 3):
+            present = arr[:, col] >= 0
+            cell, resource = cells[present], arr[present, col]
+            order = np.lexsort((resource, cell))
+            cell, resource = cell[order], resource[order]
+            duplicate = (cell[1:] == cell[:-1]) & (resource[1:] == resource[:-1])
+            clashed_cells.append(np.unique(cell[1:][duplicate]))
+        
+        clashed = np.concatenate(clashed_cells)
+        return np.bincount(clashed // len(slot_codes), minlength=len(days))
@@ -1,70 +1,258 @@
 # genetic_algorithm.py - Genetic Algorithm for Timetable Optimization
+import os
 import random
 import numpy as np
 from typing import List, Dict, Tuple, Any
 from dataclasses import dataclass
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-import copy
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, defaultdict
 
-@dataclass
-class Gene:
-    """Represents a single time slot assignment"""
-    subject_id: str
-    faculty_id: str
-    room_id: str
-    student_group_id: str
-    day: int  # 0-4 (Monday-Friday)
-    time_slot: int  # 0-7 (time slots in a day)
-    
-@dataclass
+# Gene matrix columns: each row is one class assignment, with string IDs
+# encoded as integer indices into the scheduler's ID vocabularies
+SUBJECT, FACULTY, ROOM, GROUP, DAY, SLOT = range(6)
+ID_COLUMNS = (SUBJECT, FACULTY, ROOM, GROUP)
+DAYS_PER_WEEK = 5  # 0-4 (Monday-Friday)
+SLOTS_PER_DAY = 8  # 0-7 (time slots in a day)
+SLOTS_PER_WEEK = DAYS_PER_WEEK * SLOTS_PER_DAY
+
+DAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday')
+_DAY_TO_INDEX = {day_name: index for index, day_name in enumerate(DAY_NAMES)}
+
+TIME_SLOTS = (
+    "09:00-10:00", "10:00-11:00", "11:00-12:00", "12:00-13:00",
+    "14:00-15:00", "15:00-16:00", "16:00-17:00", "17:00-18:00"
+)
+_TIME_TO_SLOT = {time_str: index for index, time_str in enumerate(TIME_SLOTS)}
+
+# Subjects that should not be scheduled back-to-back
+HEAVY_SUBJECTS = {'mathematics', 'physics', 'chemistry', 'advanced_math'}
+
+def _conflicts_kernel(faculty: np.ndarray, room: np.ndarray, group: np.ndarray,
+                      day: np.ndarray, slot: np.ndarray) -> int:
+    """Count double-bookings across faculty, room and group columns"""
+    time_key = day.astype(np.intp) * SLOTS_PER_DAY + slot
+    conflicts = 0
+    for resource in (faculty, room, group):
+        # Every class beyond the first in a (resource, day, slot) cell is one double-booking
+        counts = np.bincount(resource.astype(np.intp) * SLOTS_PER_WEEK + time_key)
+        conflicts += len(resource) - int(np.count_nonzero(counts))
+    return conflicts
+
+def _green_kernel(faculty: np.ndarray, day: np.ndarray, slot: np.ndarray,
+                  room: np.ndarray) -> Tuple[int, int]:
+    """Count faculty room changes between consecutive classes on the same day"""
+    order = np.lexsort((slot, day, faculty))
+    faculty, day, room = faculty[order], day[order], room[order]
+    
+    same_day = (faculty[1:] == faculty[:-1]) & (day[1:] == day[:-1])
+    movements = same_day & (room[1:] != room[:-1])
+    return int(movements.sum()), int(same_day.sum())
+
+def _fatigue_kernel(group: np.ndarray, day: np.ndarray, slot: np.ndarray,
+                    subject: np.ndarray, heavy_mask: np.ndarray) -> Tuple[int, int]:
+    """Count back-to-back heavy subject pairs among a group's consecutive classes"""
+    order = np.lexsort((slot, day, group))
+    group, day, slot = group[order], day[order], slot[order]
+    heavy = heavy_mask[subject[order]]
+    
+    back_to_back = (group[1:] == group[:-1]) & (day[1:] == day[:-1]) & (slot[1:] == slot[:-1] + 1)
+    violations = back_to_back & heavy[1:] & heavy[:-1]
+    return int(violations.sum()), int(back_to_back.sum())
+
+def _calculate_fitness(genes: np.ndarray, heavy_mask: np.ndarray) -> Dict[str, float]:
+    """Calculate comprehensive fitness score for a chromosome"""
+    
+    # 1. Conflict Analysis (40% weight)
+    conflict_score = _evaluate_conflicts(genes)
+    
+    # 2. Resource Utilization (25% weight)
+    utilization_score = _evaluate_utilization(genes)
+    
+    # 3. Green Optimization - Movement Minimization (20% weight)
+    green_score = _evaluate_green_optimization(genes)
+    
+    # 4. Fatigue-Free Scheduling (15% weight)
+    fatigue_score = _evaluate_fatigue_prevention(genes, heavy_mask)
+    
+    # Weighted total score
+    total_score = (
+        conflict_score * 0.40 +
+        utilization_score * 0.25 +
+        green_score * 0.20 +
+        fatigue_score * 0.15
+    )
+    
+    return {
+        'total_score': total_score,
+        'conflicts': 100 - conflict_score,
+        'utilization': utilization_score,
+        'green_score': green_score,
+        'fatigue_score': fatigue_score
+    }
+
+def _calculate_fitness_batch(genes_batch: List[np.ndarray], heavy_mask: np.ndarray) -> List[Dict[str, float]]:
+    """Calculate fitness for a batch of chromosomes in one worker call"""
+    return [_calculate_fitness(genes, heavy_mask) for genes in genes_batch]
+
+def _evaluate_conflicts(genes: np.ndarray) -> float:
+    """Evaluate and penalize scheduling conflicts"""
+    # Convert conflicts to score (0-100, higher is better)
+    max_possible_conflicts = len(genes)
+    if max_possible_conflicts == 0:
+        return 100
+    
+    conflicts = _conflicts_kernel(
+        genes[:, FACULTY], genes[:, ROOM], genes[:, GROUP], genes[:, DAY], genes[:, SLOT]
+    )
+    
+    conflict_percentage = (conflicts / max_possible_conflicts) * 100
+    return max(0, 100 - conflict_percentage * 2)  # Heavy penalty for conflicts
+
+def _evaluate_utilization(genes: np.ndarray) -> float:
+    """Evaluate resource utilization efficiency"""
+    if len(genes) == 0:
+        return 0
+    
+    # Classes per faculty member and per room (only those in use)
+    faculty_hours = np.bincount(genes[:, FACULTY])
+    faculty_hours = faculty_hours[faculty_hours > 0]
+    room_hours = np.bincount(genes[:, ROOM])
+    room_hours = room_hours[room_hours > 0]
+    
+    # Ideal utilization ranges
+    ideal_faculty_hours = 6  # 6 hours per day average
+    ideal_room_hours = 7     # 7 hours per day average
+    
+    faculty_utilization = np.minimum(100, (faculty_hours / ideal_faculty_hours) * 100)
+    # Penalty for over-utilization
+    faculty_utilization = np.where(
+        faculty_hours > ideal_faculty_hours,
+        np.maximum(0, 100 - (faculty_hours - ideal_faculty_hours) * 10),
+        faculty_utilization
+    )
+    
+    room_utilization = np.minimum(100, (room_hours / ideal_room_hours) * 100)
+    
+    # Average utilization score
+    return (faculty_utilization.mean() + room_utilization.mean()) / 2
+
+def _evaluate_green_optimization(genes: np.ndarray) -> float:
+    """Evaluate movement minimization for faculty (Green Timetable)"""
+    if len(genes) == 0:
+        return 100
+    
+    total_movements, total_possible_movements = _green_kernel(
+        genes[:, FACULTY], genes[:, DAY], genes[:, SLOT], genes[:, ROOM]
+    )
+    
+    if total_possible_movements == 0:
+        return 100
+    
+    # Calculate movement reduction percentage
+    movement_rate = total_movements / total_possible_movements
+    return max(0, 100 - (movement_rate * 100))
+
+def _evaluate_fatigue_prevention(genes: np.ndarray, heavy_mask: np.ndarray) -> float:
+    """Evaluate fatigue-free scheduling (no back-to-back heavy subjects)"""
+    if len(genes) == 0:
+        return 100
+    
+    fatigue_violations, total_checks = _fatigue_kernel(
+        genes[:, GROUP], genes[:, DAY], genes[:, SLOT], genes[:, SUBJECT], heavy_mask
+    )
+    
+    if total_checks == 0:
+        return 100
+    
+    fatigue_rate = fatigue_violations / total_checks
+    return max(0, 100 - (fatigue_rate * 100))
+    
+@dataclass(slots=True)
 class Chromosome:
     """Represents a complete timetable solution"""
-    genes: List[Gene]
+    genes: np.ndarray  # (n_genes, 6) int16 matrix, see column constants above
     fitness_score: float = 0.0
     conflict_count: int = 0
     utilization_score: float = 0.0
     green_score: float = 0.0
     fatigue_score: float = 0.0
+    
+    def clone(self) -> 'Chromosome':
+        """Copy the gene matrix and scores without a generic deepcopy"""
+        return Chromosome(
+            genes=self.genes.copy(),
+            fitness_score=self.fitness_score,
+            conflict_count=self.conflict_count,
+            utilization_score=self.utilization_score,
+            green_score=self.green_score,
+            fatigue_score=self.fatigue_score
+        )
 
 class GeneticScheduler:
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
         self.population_size = 50
         self.generations = 100
         self.mutation_rate = 0.1
         self.crossover_rate = 0.8
         self.elite_percentage = 0.2
         
+        self._worker_count = max_workers or os.cpu_count() or 1  # fitness worker processes
+        self._rng = np.random.default_rng()
+        self._pool = None  # ProcessPoolExecutor, created lazily for fitness evaluation
+        self._optimize_lock = asyncio.Lock()
+        
     async def optimize_schedule(self, initial_schedule: Dict[str, Any], optimization_level: str = "high"):
         """Main genetic algorithm optimization process"""
         
+        # Fitness batches yield to the event loop mid-run, and the GA
+        # parameters for the level live on self, so runs are serialized
+        async with self._optimize_lock:
+            return await self._run_optimization(initial_schedule, optimization_level)
+    
+    async def _run_optimization(self, initial_schedule: Dict[str, Any], optimization_level: str):
+        """One GA run; ID maps, vocabularies, heavy mask and fitness cache are local to it"""
+        
         # Set parameters based on optimization level
         self._set_optimization_parameters(optimization_level)
         
+        # Fresh ID vocabularies for this run: ID string -> index, per ID column
+        id_maps: List[Dict[str, int]] = [{} for _ in ID_COLUMNS]
+        
+        # Scores are only valid under this run's ID maps and heavy-subject mask
+        fitness_cache: OrderedDict = OrderedDict()  # genes.tobytes() -> fitness result, LRU order
+        
         # Initialize population with the greedy solution as seed
-        population = await self._initialize_population(initial_schedule)
+        population = self._initialize_population(initial_schedule, id_maps)
+        
+        # Vocabularies are complete once the population exists
+        vocabularies, heavy_mask = self._freeze_vocabularies(id_maps)
         
         best_solution = None
         best_fitness = float('-inf')
         
         for generation in range(self.generations):
             # Evaluate fitness for all chromosomes
-            await self._evaluate_population_fitness(population)
+            await self._evaluate_population_fitness(population, heavy_mask, fitness_cache)
             
             # Find best solution in current generation
-            current_best = max(population, key=lambda x: x.fitness_score)
+            fitness = np.fromiter(
+                (chromosome.fitness_score for chromosome in population),
+                dtype=np.float64, count=len(population)
+            )
+            current_best = population[int(fitness.argmax())]
             if current_best.fitness_score > best_fitness:
                 best_fitness = current_best.fitness_score
-                best_solution = copy.deepcopy(current_best)
+                best_solution = current_best.clone()
             
             # Create next generation
-            population = await self._create_next_generation(population)
+            population = self._create_next_generation(population, fitness)
             
             # Early stopping if optimal solution found
             if best_fitness >= 99.0:  # Near-perfect solution
                 break
                 
-        return await self._chromosome_to_schedule(best_solution)
+        return self._chromosome_to_schedule(best_solution, vocabularies)
     
     def _set_optimization_parameters(self, level: str):
         """Set GA parameters based on optimization level"""
@@ -81,378 +269,274 @@ class GeneticScheduler:
             self.population_size = 30
             self.mutation_rate = 0.2
     
-    async def _initialize_population(self, initial_schedule: Dict[str, Any]) -> List[Chromosome]:
+    def _initialize_population(
+        self,
+        initial_schedule: Dict[str, Any],
+        id_maps: List[Dict[str, int]]
+    ) -> List[Chromosome]:
         """Initialize population with diverse solutions"""
         population = []
         
         # Convert initial schedule to chromosome
-        base_chromosome = await self._schedule_to_chromosome(initial_schedule)
+        base_chromosome = self._schedule_to_chromosome(initial_schedule, id_maps)
         population.append(base_chromosome)
         
         # Generate diverse population through mutations and random generation
         for _ in range(self.population_size - 1):
             if random.random() < 0.5:
                 # Create mutated version of base solution
-                new_chromosome = copy.deepcopy(base_chromosome)
-                await self._mutate_chromosome(new_chromosome, rate=0.3)
+                new_chromosome = base_chromosome.clone()
+                self._mutate_chromosome(new_chromosome, rate=0.3)
             else:
                 # Create random solution
-                new_chromosome = await self._generate_random_chromosome(initial_schedule)
+                new_chromosome = self._generate_random_chromosome(initial_schedule, id_maps)
             
             population.append(new_chromosome)
             
         return population
     
-    async def _schedule_to_chromosome(self, schedule: Dict[str, Any]) -> Chromosome:
+    def _schedule_to_chromosome(self, schedule: Dict[str, Any], id_maps: List[Dict[str, int]]) -> Chromosome:
         """Convert schedule dictionary to chromosome representation"""
-        genes = []
+        rows = []
         
         for day_name, day_schedule in schedule.get('weekly_schedule', {}).items():
-            day_idx = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday'].index(day_name.lower())
+            day_idx = _DAY_TO_INDEX[day_name.lower()]
             
             for time_slot, classes in day_schedule.items():
                 slot_idx = self._time_to_slot_index(time_slot)
                 
                 if isinstance(classes, list):
                     for class_info in classes:
-                        gene = Gene(
-                            subject_id=class_info.get('subject_id', ''),
-                            faculty_id=class_info.get('faculty_id', ''),
-                            room_id=class_info.get('room_id', ''),
-                            student_group_id=class_info.get('group_id', ''),
-                            day=day_idx,
-                            time_slot=slot_idx
-                        )
-                        genes.append(gene)
-        
-        return Chromosome(genes=genes)
+                        rows.append((
+                            self._encode_id(id_maps, SUBJECT, class_info.get('subject_id', '')),
+                            self._encode_id(id_maps, FACULTY, class_info.get('faculty_id', '')),
+                            self._encode_id(id_maps, ROOM, class_info.get('room_id', '')),
+                            self._encode_id(id_maps, GROUP, class_info.get('group_id', '')),
+                            day_idx,
+                            slot_idx
+                        ))
+        
+        return Chromosome(genes=np.array(rows, dtype=np.int16).reshape(-1, 6))
+    
+    def _encode_id(self, id_maps: List[Dict[str, int]], column: int, value: str) -> int:
+        """Map a string ID to its integer index in the column's vocabulary"""
+        id_map = id_maps[column]
+        return id_map.setdefault(value, len(id_map))
     
-    async def _generate_random_chromosome(self, schedule_template: Dict[str, Any]) -> Chromosome:
+    def _template_ids(self, id_maps: List[Dict[str, int]], column: int, entries: List[Any]) -> List[int]:
+        """Encode resource entries (dicts with an 'id' key, or plain IDs)"""
+        return [
+            self._encode_id(id_maps, column, entry.get('id', '') if isinstance(entry, dict) else entry)
+            for entry in entries
+        ]
+    
+    def _generate_random_chromosome(
+        self,
+        schedule_template: Dict[str, Any],
+        id_maps: List[Dict[str, int]]
+    ) -> Chromosome:
         """Generate a random chromosome for population diversity"""
-        genes = []
-        
         # Get available resources
-        subjects = schedule_template.get('subjects', [])
-        faculty = schedule_template.get('faculty', [])
-        rooms = schedule_template.get('rooms', [])
-        groups = schedule_template.get('student_groups', [])
-        
-        # Generate random assignments
-        for _ in range(len(subjects) * 3):  # Approximate number of classes
-            gene = Gene(
-                subject_id=random.choice(subjects).get('id', '') if subjects else '',
-                faculty_id=random.choice(faculty).get('id', '') if faculty else '',
-                room_id=random.choice(rooms).get('id', '') if rooms else '',
-                student_group_id=random.choice(groups).get('id', '') if groups else '',
-                day=random.randint(0, 4),
-                time_slot=random.randint(0, 7)
-            )
-            genes.append(gene)
+        subjects = self._template_ids(id_maps, SUBJECT, schedule_template.get('subjects', []))
+        n_genes = len(subjects) * 3  # Approximate number of classes
+        genes = np.empty((n_genes, 6), dtype=np.int16)
+        if n_genes == 0:
+            return Chromosome(genes=genes)
+        
+        resources = (
+            (SUBJECT, subjects),
+            (FACULTY, self._template_ids(id_maps, FACULTY, schedule_template.get('faculty', []))),
+            (ROOM, self._template_ids(id_maps, ROOM, schedule_template.get('rooms', []))),
+            (GROUP, self._template_ids(id_maps, GROUP, schedule_template.get('student_groups', [])))
+        )
+        
+        # Generate random assignments, one vectorized draw per column
+        rng = self._rng
+        for column, ids in resources:
+            choices = np.array(ids or [self._encode_id(id_maps, column, '')], dtype=np.int16)
+            genes[:, column] = choices[rng.integers(0, len(choices), n_genes)]
+        genes[:, DAY] = rng.integers(0, DAYS_PER_WEEK, n_genes)
+        genes[:, SLOT] = rng.integers(0, SLOTS_PER_DAY, n_genes)
         
         return Chromosome(genes=genes)
     
-    async def _evaluate_population_fitness(self, population: List[Chromosome]):
+    async def _evaluate_population_fitness(
+        self,
+        population: List[Chromosome],
+        heavy_mask: np.ndarray,
+        fitness_cache: OrderedDict
+    ):
         """Evaluate fitness for entire population using parallel processing"""
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            fitness_tasks = [
-                executor.submit(self._calculate_fitness, chromosome) 
-                for chromosome in population
-            ]
-            
-            for i, task in enumerate(fitness_tasks):
-                fitness_result = task.result()
-                population[i].fitness_score = fitness_result['total_score']
-                population[i].conflict_count = fitness_result['conflicts']
-                population[i].utilization_score = fitness_result['utilization']
-                population[i].green_score = fitness_result['green_score']
-                population[i].fatigue_score = fitness_result['fatigue_score']
-    
-    def _calculate_fitness(self, chromosome: Chromosome) -> Dict[str, float]:
-        """Calculate comprehensive fitness score for a chromosome"""
-        
-        # 1. Conflict Analysis (40% weight)
-        conflict_score = self._evaluate_conflicts(chromosome)
-        
-        # 2. Resource Utilization (25% weight)
-        utilization_score = self._evaluate_utilization(chromosome)
-        
-        # 3. Green Optimization - Movement Minimization (20% weight)
-        green_score = self._evaluate_green_optimization(chromosome)
-        
-        # 4. Fatigue-Free Scheduling (15% weight)
-        fatigue_score = self._evaluate_fatigue_prevention(chromosome)
-        
-        # Weighted total score
-        total_score = (
-            conflict_score * 0.40 +
-            utilization_score * 0.25 +
-            green_score * 0.20 +
-            fatigue_score * 0.15
-        )
-        
-        return {
-            'total_score': total_score,
-            'conflicts': 100 - conflict_score,
-            'utilization': utilization_score,
-            'green_score': green_score,
-            'fatigue_score': fatigue_score
-        }
-    
-    def _evaluate_conflicts(self, chromosome: Chromosome) -> float:
-        """Evaluate and penalize scheduling conflicts"""
-        conflicts = 0
-        faculty_schedule = {}
-        room_schedule = {}
-        student_schedule = {}
-        
-        for gene in chromosome.genes:
-            time_key = f"{gene.day}_{gene.time_slot}"
-            
-            # Faculty conflict check
-            if gene.faculty_id in faculty_schedule:
-                if time_key in faculty_schedule[gene.faculty_id]:
-                    conflicts += 1
-                else:
-                    faculty_schedule[gene.faculty_id].add(time_key)
+        # Reuse scores for gene matrices seen recently (elites, uncrossed copies)
+        pending: Dict[bytes, List[Chromosome]] = {}
+        for chromosome in population:
+            key = chromosome.genes.tobytes()
+            fitness_result = fitness_cache.get(key)
+            if fitness_result is not None:
+                fitness_cache.move_to_end(key)
+                self._apply_fitness(chromosome, fitness_result)
             else:
-                faculty_schedule[gene.faculty_id] = {time_key}
-            
-            # Room conflict check
-            if gene.room_id in room_schedule:
-                if time_key in room_schedule[gene.room_id]:
-                    conflicts += 1
-                else:
-                    room_schedule[gene.room_id].add(time_key)
-            else:
-                room_schedule[gene.room_id] = {time_key}
-            
-            # Student group conflict check
-            if gene.student_group_id in student_schedule:
-                if time_key in student_schedule[gene.student_group_id]:
-                    conflicts += 1
-                else:
-                    student_schedule[gene.student_group_id].add(time_key)
-            else:
-                student_schedule[gene.student_group_id] = {time_key}
+                pending.setdefault(key, []).append(chromosome)
         
-        # Convert conflicts to score (0-100, higher is better)
-        max_possible_conflicts = len(chromosome.genes)
-        if max_possible_conflicts == 0:
-            return 100
+        if not pending:
+            return
         
-        conflict_percentage = (conflicts / max_possible_conflicts) * 100
-        return max(0, 100 - conflict_percentage * 2)  # Heavy penalty for conflicts
+        pool = self._get_process_pool()
+        loop = asyncio.get_running_loop()
+        chunksize = max(1, len(pending) // (4 * self._worker_count))
+        
+        # Submit batches to the pool without blocking the event loop, and
+        # record each batch's scores as soon as its worker finishes
+        keys = list(pending)
+        batches = [keys[start:start + chunksize] for start in range(0, len(keys), chunksize)]
+        
+        async def evaluate_batch(batch_keys: List[bytes]):
+            fitness_results = await loop.run_in_executor(
+                pool,
+                _calculate_fitness_batch,
+                [pending[key][0].genes for key in batch_keys],
+                heavy_mask
+            )
+            return batch_keys, fitness_results
+        
+        for completed in asyncio.as_completed([evaluate_batch(batch) for batch in batches]):
+            batch_keys, fitness_results = await completed
+            for key, fitness_result in zip(batch_keys, fitness_results):
+                fitness_cache[key] = fitness_result
+                for chromosome in pending[key]:
+                    self._apply_fitness(chromosome, fitness_result)
+        
+        # Evict least recently used entries beyond the cap
+        cache_limit = self.population_size * 10
+        while len(fitness_cache) > cache_limit:
+            fitness_cache.popitem(last=False)
     
-    def _evaluate_utilization(self, chromosome: Chromosome) -> float:
-        """Evaluate resource utilization efficiency"""
-        if not chromosome.genes:
-            return 0
-        
-        # Calculate faculty utilization
-        faculty_hours = {}
-        room_hours = {}
-        
-        for gene in chromosome.genes:
-            faculty_hours[gene.faculty_id] = faculty_hours.get(gene.faculty_id, 0) + 1
-            room_hours[gene.room_id] = room_hours.get(gene.room_id, 0) + 1
-        
-        # Ideal utilization ranges
-        ideal_faculty_hours = 6  # 6 hours per day average
-        ideal_room_hours = 7     # 7 hours per day average
-        
-        faculty_utilization = []
-        for hours in faculty_hours.values():
-            if hours == 0:
-                utilization = 0
-            else:
-                utilization = min(100, (hours / ideal_faculty_hours) * 100)
-                # Penalty for over-utilization
-                if hours > ideal_faculty_hours:
-                    utilization = max(0, 100 - (hours - ideal_faculty_hours) * 10)
-            faculty_utilization.append(utilization)
-        
-        room_utilization = []
-        for hours in room_hours.values():
-            if hours == 0:
-                utilization = 0
-            else:
-                utilization = min(100, (hours / ideal_room_hours) * 100)
-            room_utilization.append(utilization)
-        
-        # Average utilization score
-        avg_faculty_util = np.mean(faculty_utilization) if faculty_utilization else 0
-        avg_room_util = np.mean(room_utilization) if room_utilization else 0
-        
-        return (avg_faculty_util + avg_room_util) / 2
-    
-    def _evaluate_green_optimization(self, chromosome: Chromosome) -> float:
-        """Evaluate movement minimization for faculty (Green Timetable)"""
-        if not chromosome.genes:
-            return 100
-        
-        faculty_movements = {}
-        
-        # Group genes by faculty and day
-        faculty_daily_schedule = {}
-        for gene in chromosome.genes:
-            if gene.faculty_id not in faculty_daily_schedule:
-                faculty_daily_schedule[gene.faculty_id] = {}
-            if gene.day not in faculty_daily_schedule[gene.faculty_id]:
-                faculty_daily_schedule[gene.faculty_id][gene.day] = []
-            faculty_daily_schedule[gene.faculty_id][gene.day].append(gene)
-        
-        total_movements = 0
-        total_possible_movements = 0
-        
-        for faculty_id, daily_schedule in faculty_daily_schedule.items():
-            for day, day_genes in daily_schedule.items():
-                if len(day_genes) <= 1:
-                    continue
-                
-                # Sort by time slot
-                day_genes.sort(key=lambda x: x.time_slot)
-                
-                # Count room changes (movements)
-                movements = 0
-                for i in range(len(day_genes) - 1):
-                    if day_genes[i].room_id != day_genes[i + 1].room_id:
-                        movements += 1
-                
-                total_movements += movements
-                total_possible_movements += len(day_genes) - 1
-        
-        if total_possible_movements == 0:
-            return 100
-        
-        # Calculate movement reduction percentage
-        movement_rate = total_movements / total_possible_movements
-        return max(0, 100 - (movement_rate * 100))
-    
-    def _evaluate_fatigue_prevention(self, chromosome: Chromosome) -> float:
-        """Evaluate fatigue-free scheduling (no back-to-back heavy subjects)"""
-        if not chromosome.genes:
-            return 100
-        
-        # Define heavy subjects (this would come from configuration)
-        heavy_subjects = {'mathematics', 'physics', 'chemistry', 'advanced_math'}
-        
-        fatigue_violations = 0
-        total_checks = 0
-        
-        # Group by student groups and days
-        group_daily_schedule = {}
-        for gene in chromosome.genes:
-            if gene.student_group_id not in group_daily_schedule:
-                group_daily_schedule[gene.student_group_id] = {}
-            if gene.day not in group_daily_schedule[gene.student_group_id]:
-                group_daily_schedule[gene.student_group_id][gene.day] = []
-            group_daily_schedule[gene.student_group_id][gene.day].append(gene)
-        
-        for group_id, daily_schedule in group_daily_schedule.items():
-            for day, day_genes in daily_schedule.items():
-                if len(day_genes) <= 1:
-                    continue
-                
-                # Sort by time slot
-                day_genes.sort(key=lambda x: x.time_slot)
-                
-                # Check for back-to-back heavy subjects
-                for i in range(len(day_genes) - 1):
-                    current_subject = day_genes[i].subject_id.lower()
-                    next_subject = day_genes[i + 1].subject_id.lower()
-                    
-                    # Check if consecutive time slots
-                    if day_genes[i + 1].time_slot == day_genes[i].time_slot + 1:
-                        total_checks += 1
-                        if (current_subject in heavy_subjects and 
-                            next_subject in heavy_subjects):
-                            fatigue_violations += 1
-        
-        if total_checks == 0:
-            return 100
-        
-        fatigue_rate = fatigue_violations / total_checks
-        return max(0, 100 - (fatigue_rate * 100))
-    
-    async def _create_next_generation(self, population: List[Chromosome]) -> List[Chromosome]:
+    def _apply_fitness(self, chromosome: Chromosome, fitness_result: Dict[str, float]):
+        """Copy a fitness result onto a chromosome"""
+        chromosome.fitness_score = fitness_result['total_score']
+        chromosome.conflict_count = fitness_result['conflicts']
+        chromosome.utilization_score = fitness_result['utilization']
+        chromosome.green_score = fitness_result['green_score']
+        chromosome.fatigue_score = fitness_result['fatigue_score']
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the fitness worker pool on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._worker_count)
+        return self._pool
+    
+    def close(self):
+        """Shut down the fitness worker pool without waiting for pending batches"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    def _freeze_vocabularies(
+        self,
+        id_maps: List[Dict[str, int]]
+    ) -> Tuple[Tuple[Tuple[str, ...], ...], np.ndarray]:
+        """Snapshot index -> ID vocabularies per ID column, plus the heavy flag per subject index"""
+        vocabularies = tuple(tuple(id_maps[column]) for column in ID_COLUMNS)
+        heavy_mask = np.array(
+            [subject_id.lower() in HEAVY_SUBJECTS for subject_id in vocabularies[SUBJECT]],
+            dtype=bool
+        )
+        return vocabularies, heavy_mask
+    
+    def _create_next_generation(self, population: List[Chromosome], fitness: np.ndarray) -> List[Chromosome]:
         """Create next generation using selection, crossover, and mutation"""
-        # Sort population by fitness
-        population.sort(key=lambda x: x.fitness_score, reverse=True)
-        
         new_population = []
-        elite_count = int(self.population_size * self.elite_percentage)
+        elite_count = min(int(self.population_size * self.elite_percentage), len(population))
+        
+        # Elitism - keep best solutions (partitioned, no full sort needed)
+        if elite_count > 0:
+            elite_indices = np.argpartition(-fitness, elite_count - 1)[:elite_count]
+            new_population.extend(population[i] for i in elite_indices.tolist())
         
-        # Elitism - keep best solutions
-        new_population.extend(population[:elite_count])
+        # Tournament selection - all parents for this generation in one draw
+        pair_count = max(0, self.population_size - len(new_population) + 1) // 2
+        parent_indices = self._tournament_selection(fitness, pair_count * 2)
         
         # Generate remaining population through crossover and mutation
-        while len(new_population) < self.population_size:
-            # Tournament selection
-            parent1 = self._tournament_selection(population)
-            parent2 = self._tournament_selection(population)
+        for parent1_idx, parent2_idx in parent_indices.reshape(-1, 2).tolist():
+            parent1 = population[parent1_idx]
+            parent2 = population[parent2_idx]
             
             # Crossover
             if random.random() < self.crossover_rate:
-                child1, child2 = await self._crossover(parent1, parent2)
+                child1, child2 = self._crossover(parent1, parent2)
             else:
-                child1, child2 = copy.deepcopy(parent1), copy.deepcopy(parent2)
+                child1, child2 = parent1.clone(), parent2.clone()
             
             # Mutation
             if random.random() < self.mutation_rate:
-                await self._mutate_chromosome(child1)
+                self._mutate_chromosome(child1)
             if random.random() < self.mutation_rate:
-                await self._mutate_chromosome(child2)
+                self._mutate_chromosome(child2)
             
             new_population.extend([child1, child2])
         
         # Trim to exact population size
         return new_population[:self.population_size]
     
-    def _tournament_selection(self, population: List[Chromosome], tournament_size: int = 5) -> Chromosome:
-        """Tournament selection for parent selection"""
-        tournament = random.sample(population, min(tournament_size, len(population)))
-        return max(tournament, key=lambda x: x.fitness_score)
+    def _tournament_selection(self, fitness: np.ndarray, winner_count: int,
+                              tournament_size: int = 5) -> np.ndarray:
+        """Run winner_count tournaments at once and return the winning population indices"""
+        contenders = self._rng.integers(
+            0, len(fitness), size=(winner_count, min(tournament_size, len(fitness)))
+        )
+        return contenders[np.arange(winner_count), fitness[contenders].argmax(axis=1)]
     
-    async def _crossover(self, parent1: Chromosome, parent2: Chromosome) -> Tuple[Chromosome, Chromosome]:
+    def _crossover(self, parent1: Chromosome, parent2: Chromosome) -> Tuple[Chromosome, Chromosome]:
         """Single-point crossover between two chromosomes"""
-        if not parent1.genes or not parent2.genes:
-            return copy.deepcopy(parent1), copy.deepcopy(parent2)
+        if len(parent1.genes) == 0 or len(parent2.genes) == 0:
+            return parent1.clone(), parent2.clone()
         
         # Find crossover point
         min_length = min(len(parent1.genes), len(parent2.genes))
         crossover_point = random.randint(1, min_length - 1)
         
-        # Create children
-        child1_genes = parent1.genes[:crossover_point] + parent2.genes[crossover_point:]
-        child2_genes = parent2.genes[:crossover_point] + parent1.genes[crossover_point:]
+        # Create children: each takes its tail (and therefore its length) from the other parent
+        child1_genes = np.empty_like(parent2.genes)
+        child1_genes[:crossover_point] = parent1.genes[:crossover_point]
+        child1_genes[crossover_point:] = parent2.genes[crossover_point:]
+        
+        child2_genes = np.empty_like(parent1.genes)
+        child2_genes[:crossover_point] = parent2.genes[:crossover_point]
+        child2_genes[crossover_point:] = parent1.genes[crossover_point:]
         
         child1 = Chromosome(genes=child1_genes)
         child2 = Chromosome(genes=child2_genes)
         
         return child1, child2
     
-    async def _mutate_chromosome(self, chromosome: Chromosome, rate: float = None):
+    def _mutate_chromosome(self, chromosome: Chromosome, rate: float = None):
         """Mutate chromosome by randomly changing gene properties"""
-        if not chromosome.genes:
+        genes = chromosome.genes
+        n_genes = len(genes)
+        if n_genes == 0:
             return
         
         mutation_rate = rate if rate is not None else self.mutation_rate
         
-        for gene in chromosome.genes:
-            if random.random() < mutation_rate:
-                # Randomly choose what to mutate
-                mutation_type = random.choice(['day', 'time_slot', 'room_id'])
-                
-                if mutation_type == 'day':
-                    gene.day = random.randint(0, 4)
-                elif mutation_type == 'time_slot':
-                    gene.time_slot = random.randint(0, 7)
-                elif mutation_type == 'room_id':
-                    # This would need access to available rooms
-                    # For now, just modify slightly
-                    pass
-    
-    async def _chromosome_to_schedule(self, chromosome: Chromosome) -> Dict[str, Any]:
+        # Randomly choose which genes mutate and what to mutate (0=day, 1=time_slot, 2=room_id)
+        rng = self._rng
+        mutated = rng.random(n_genes) < mutation_rate
+        mutation_type = rng.integers(0, 3, n_genes)
+        
+        day_mask = mutated & (mutation_type == 0)
+        genes[day_mask, DAY] = rng.integers(0, DAYS_PER_WEEK, int(day_mask.sum()))
+        
+        slot_mask = mutated & (mutation_type == 1)
+        genes[slot_mask, SLOT] = rng.integers(0, SLOTS_PER_DAY, int(slot_mask.sum()))
+        
+        # Room mutation would need access to available rooms; left unchanged for now
+    
+    def _chromosome_to_schedule(
+        self,
+        chromosome: Chromosome,
+        vocabularies: Tuple[Tuple[str, ...], ...]
+    ) -> Dict[str, Any]:
         """Convert chromosome back to schedule format"""
         schedule = {
             'weekly_schedule': {},
@@ -471,46 +555,29 @@ class GeneticScheduler:
             }
         }
         
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+        # Per-day time slot -> classes, created on first use
+        weekly_schedule = [defaultdict(list) for _ in DAY_NAMES]
         
-        # Initialize days
-        for day in days:
-            schedule['weekly_schedule'][day] = {}
+        subject_ids, faculty_ids, room_ids, group_ids = (vocabularies[column] for column in ID_COLUMNS)
         
         # Populate schedule from genes
-        for gene in chromosome.genes:
-            day_name = days[gene.day]
-            time_slot = self._slot_index_to_time(gene.time_slot)
-            
-            if time_slot not in schedule['weekly_schedule'][day_name]:
-                schedule['weekly_schedule'][day_name][time_slot] = []
-            
-            class_info = {
-                'subject_id': gene.subject_id,
-                'faculty_id': gene.faculty_id,
-                'room_id': gene.room_id,
-                'group_id': gene.student_group_id
-            }
-            
-            schedule['weekly_schedule'][day_name][time_slot].append(class_info)
-        
+        for subject, faculty, room, group, day, slot in chromosome.genes.tolist():
+            weekly_schedule[day][self._slot_index_to_time(slot)].append({
+                'subject_id': subject_ids[subject],
+                'faculty_id': faculty_ids[faculty],
+                'room_id': room_ids[room],
+                'group_id': group_ids[group]
+            })
+        
+        schedule['weekly_schedule'] = {
+            day_name: dict(day_schedule) for day_name, day_schedule in zip(DAY_NAMES, weekly_schedule)
+        }
         return schedule
     
     def _time_to_slot_index(self, time_str: str) -> int:
         """Convert time string to slot index"""
-        time_slots = [
-            "09:00-10:00", "10:00-11:00", "11:00-12:00", "12:00-13:00",
-            "14:00-15:00", "15:00-16:00", "16:00-17:00", "17:00-18:00"
-        ]
-        try:
-            return time_slots.index(time_str)
-        except ValueError:
-            return 0
+        return _TIME_TO_SLOT.get(time_str, 0)
     
     def _slot_index_to_time(self, index: int) -> str:
         """Convert slot index to time string"""
-        time_slots = [
-            "09:00-10:00", "10:00-11:00", "11:00-12:00", "12:00-13:00",
-            "14:00-15:00", "15:00-16:00", "16:00-17:00", "17:00-18:00"
-        ]
-        return time_slots[min(index, len(time_slots) - 1)]
\ No newline at end of file
+        return TIME_SLOTS[min(index, SLOTS_PER_DAY - 1)]
\ No newline at end of file
@@ -4,7 +4,16 @@ from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
 from collections import defaultdict
-import heapq
+import numpy as np
+
+DAY_INDEX = {'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3, 'friday': 4}
+
+# Subjects penalised when scheduled in the afternoon/evening
+HEAVY_SUBJECTS = frozenset({'mathematics', 'physics', 'chemistry'})
+
+def _dmask(period: int, duration: int) -> int:
+    """Bitmask covering `duration` periods starting at `period`"""
+    return ((1 << duration) - 1) << period
 
 class Priority(Enum):
     """Priority levels for scheduling decisions"""
@@ -12,28 +21,20 @@ class Priority(Enum):
     MEDIUM = 2
     LOW = 3
 
-@dataclass
-class TimeSlot:
-    """Represents a time slot in the timetable"""
-    day: int  # 0-4 (Monday-Friday)
-    period: int  # 0-7 (periods in a day)
-    
-    def __hash__(self):
-        return hash((self.day, self.period))
-    
-    def __eq__(self, other):
-        return self.day == other.day and self.period == other.period
-
-@dataclass
+@dataclass(slots=True)
 class SchedulingConstraint:
     """Represents various scheduling constraints"""
     faculty_id: str
-    unavailable_slots: Set[TimeSlot] = field(default_factory=set)
+    unavailable_slots: Set[int] = field(default_factory=set)  # packed day * periods_per_day + period
     max_consecutive_hours: int = 3
     preferred_days: List[int] = field(default_factory=list)
     min_gap_between_classes: int = 0
+    preferred_day_set: Set[int] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.preferred_day_set = set(self.preferred_days)
 
-@dataclass
+@dataclass(slots=True)
 class ClassRequirement:
     """Represents a class that needs to be scheduled"""
     subject_id: str
@@ -44,24 +45,37 @@ class ClassRequirement:
     duration: int = 1  # number of periods
     weekly_frequency: int = 1
     priority: Priority = Priority.MEDIUM
-    preferred_slots: List[TimeSlot] = field(default_factory=list)
-    
-    def __lt__(self, other):
-        return self.priority.value < other.priority.value
+    preferred_slots: List[int] = field(default_factory=list)  # packed day * periods_per_day + period
+    is_heavy: bool = False  # subject_name is in HEAVY_SUBJECTS
 
 class GreedyScheduler:
     """Greedy algorithm for initial timetable generation"""
     
     def __init__(self):
-        self.schedule_matrix = {}  # [day][period] -> class_info
-        self.faculty_schedule = defaultdict(set)  # faculty_id -> set of TimeSlots
-        self.room_schedule = defaultdict(set)  # room_id -> set of TimeSlots
-        self.group_schedule = defaultdict(set)  # group_id -> set of TimeSlots
+        self.schedule_matrix = []  # [day * periods_per_day + period] -> class_info
         self.constraints = {}  # faculty_id -> SchedulingConstraint
         
         # Time slots configuration
         self.days = 5  # Monday to Friday
         self.periods_per_day = 8  # 9 AM to 5 PM
+        
+        # Occupancy bitmasks: [resource index, day] -> bit p set if period p is busy
+        self.faculty_index: Dict[str, int] = {}
+        self.room_index: Dict[str, int] = {}
+        self.group_index: Dict[str, int] = {}
+        self.faculty_masks = np.zeros((0, self.days), dtype=np.uint8)
+        self.room_masks = np.zeros((0, self.days), dtype=np.uint8)
+        self.group_masks = np.zeros((0, self.days), dtype=np.uint8)
+        self.faculty_unavailable = np.zeros((0, self.days), dtype=np.uint8)
+        self.group_day_count = np.zeros((0, self.days), dtype=np.int64)  # periods booked per group per day
+        self.faculty_slot_room: Dict[Tuple[str, int], str] = {}  # (faculty_id, packed slot) -> room_id
+        
+        # Rooms per type as parallel arrays: ids, capacities and rows into room_masks
+        self.room_ids: Dict[str, np.ndarray] = {}
+        self.room_caps: Dict[str, np.ndarray] = {}
+        self.room_rows: Dict[str, np.ndarray] = {}
+        self._faculty_terms_cache: Dict[Tuple, np.ndarray] = {}  # see _faculty_score_terms
+        self._schedule_lock = asyncio.Lock()
         self.time_slots = [
             "09:00-10:00", "10:00-11:00", "11:00-12:00", "12:00-13:00",
             "14:00-15:00", "15:00-16:00", "16:00-17:00", "17:00-18:00"
@@ -70,36 +84,78 @@ class GreedyScheduler:
     async def generate_initial_schedule(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Main entry point for greedy scheduling algorithm"""
         
+        # Scheduling is CPU-bound with no I/O: run the synchronous core in a
+        # worker thread so the event loop stays responsive. Runs share the
+        # occupancy state on self, so they are serialized
+        async with self._schedule_lock:
+            return await asyncio.to_thread(self.generate_schedule, request_data)
+    
+    def generate_schedule(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Synchronous greedy scheduling for callers outside an event loop"""
+        
         # Initialize scheduling environment
         self._initialize_schedule_matrix()
         
         # Parse input data
-        class_requirements = await self._parse_class_requirements(request_data)
-        available_rooms = await self._parse_room_data(request_data)
-        faculty_constraints = await self._parse_faculty_constraints(request_data)
+        class_requirements = self._parse_class_requirements(request_data)
+        available_rooms = self._parse_room_data(request_data)
+        faculty_constraints = self._parse_faculty_constraints(request_data)
         
         # Store constraints
         self.constraints.update(faculty_constraints)
         
+        # Map resources to matrix rows and clear occupancy
+        self._initialize_occupancy(class_requirements, available_rooms)
+        
         # Priority-based scheduling
-        scheduled_classes = await self._schedule_classes_greedily(
+        scheduled_classes = self._schedule_classes_greedily(
             class_requirements, available_rooms
         )
         
         # Generate final schedule format
-        final_schedule = await self._generate_schedule_output(scheduled_classes)
+        final_schedule = self._generate_schedule_output(scheduled_classes)
         
         return final_schedule
     
     def _initialize_schedule_matrix(self):
         """Initialize empty schedule matrix"""
-        self.schedule_matrix = {}
-        for day in range(self.days):
-            self.schedule_matrix[day] = {}
-            for period in range(self.periods_per_day):
-                self.schedule_matrix[day][period] = None
+        self.schedule_matrix = [None] * (self.days * self.periods_per_day)
     
-    async def _parse_class_requirements(self, request_data: Dict[str, Any]) -> List[ClassRequirement]:
+    def _initialize_occupancy(
+        self,
+        requirements: List[ClassRequirement],
+        available_rooms: Dict[str, List[Dict]]
+    ):
+        """Index faculty, rooms and groups and allocate empty occupancy bitmasks"""
+        self.faculty_index = {f: i for i, f in enumerate(dict.fromkeys(r.faculty_id for r in requirements))}
+        self.group_index = {g: i for i, g in enumerate(dict.fromkeys(r.student_group_id for r in requirements))}
+        self.room_index = {
+            room_id: i for i, room_id in enumerate(dict.fromkeys(
+                room['room_id'] for rooms in available_rooms.values() for room in rooms
+            ))
+        }
+        
+        self.faculty_masks = np.zeros((len(self.faculty_index), self.days), dtype=np.uint8)
+        self.room_masks = np.zeros((len(self.room_index), self.days), dtype=np.uint8)
+        self.group_masks = np.zeros((len(self.group_index), self.days), dtype=np.uint8)
+        self.room_rows = {
+            room_type: np.array([self.room_index[room_id] for room_id in room_ids], dtype=np.intp)
+            for room_type, room_ids in self.room_ids.items()
+        }
+        self.group_day_count = np.zeros((len(self.group_index), self.days), dtype=np.int64)
+        self.faculty_slot_room = {}
+        self._faculty_terms_cache = {}
+        
+        # Faculty unavailability as the same per-day bitmasks
+        self.faculty_unavailable = np.zeros((len(self.faculty_index), self.days), dtype=np.uint8)
+        for faculty_id, faculty_idx in self.faculty_index.items():
+            if faculty_id in self.constraints:
+                for slot in self.constraints[faculty_id].unavailable_slots:
+                    day, period = divmod(slot, self.periods_per_day)
+                    if 0 <= day < self.days:
+                        self.faculty_unavailable[faculty_idx, day] |= 1 << period
+    
+    def _parse_class_requirements(self, request_data: Dict[str, Any]) -> List[ClassRequirement]:
         """Parse and prioritize class requirements"""
         requirements = []
         
@@ -107,50 +163,76 @@ class GreedyScheduler:
         subjects = request_data.get('subjects', [])
         student_groups = request_data.get('student_groups', [])
         
+        # Index groups by (program, semester) so each subject only visits the
+        # groups that need it; subjects without programs match any program
+        groups_by_key = defaultdict(list)
+        groups_by_semester = defaultdict(list)
+        for group_idx, group in enumerate(student_groups):
+            semester = group.get('semester', 0)
+            groups_by_key[(group.get('program', '').lower(), semester)].append(group_idx)
+            groups_by_semester[semester].append(group_idx)
+        
         for subject in subjects:
-            for group in student_groups:
-                # Check if this group needs this subject
-                if self._group_needs_subject(group, subject):
-                    # Determine priority based on subject type (NEP 2020 categories)
-                    priority = self._determine_subject_priority(subject)
-                    
-                    # Calculate weekly frequency based on credits
-                    weekly_freq = max(1, subject.get('credits', 3) // 2)
-                    
-                    # Create class requirement for theory
-                    if subject.get('theory_hours', 0) > 0:
-                        req = ClassRequirement(
-                            subject_id=subject.get('subject_id', ''),
-                            subject_name=subject.get('name', ''),
-                            faculty_id=subject.get('faculty_id', ''),
-                            student_group_id=group.get('group_id', ''),
-                            room_type='lecture',
-                            duration=1,
-                            weekly_frequency=weekly_freq,
-                            priority=priority
-                        )
-                        requirements.append(req)
-                    
-                    # Create class requirement for practical
-                    if subject.get('practical_hours', 0) > 0:
-                        req = ClassRequirement(
-                            subject_id=subject.get('subject_id', '') + '_lab',
-                            subject_name=subject.get('name', '') + ' Lab',
-                            faculty_id=subject.get('faculty_id', ''),
-                            student_group_id=group.get('group_id', ''),
-                            room_type='lab',
-                            duration=2,  # Labs typically take 2 hours
-                            weekly_frequency=max(1, weekly_freq // 2),
-                            priority=priority
-                        )
-                        requirements.append(req)
-        
-        # Sort by priority (HIGH -> MEDIUM -> LOW)
-        requirements.sort()
+            semester = subject.get('semester', 0)
+            subject_programs = {p.lower() for p in subject.get('programs', [])}
+            if subject_programs:
+                group_indices = sorted(
+                    group_idx
+                    for program in subject_programs
+                    for group_idx in groups_by_key.get((program, semester), ())
+                )
+            else:
+                group_indices = groups_by_semester.get(semester, ())
+            if not group_indices:
+                continue
+            
+            # Determine priority based on subject type (NEP 2020 categories)
+            priority = self._determine_subject_priority(subject)
+            
+            # Calculate weekly frequency based on credits
+            weekly_freq = max(1, subject.get('credits', 3) // 2)
+            
+            for group_idx in group_indices:
+                group = student_groups[group_idx]
+                
+                # Create class requirement for theory
+                if subject.get('theory_hours', 0) > 0:
+                    req = ClassRequirement(
+                        subject_id=subject.get('subject_id', ''),
+                        subject_name=subject.get('name', ''),
+                        faculty_id=subject.get('faculty_id', ''),
+                        student_group_id=group.get('group_id', ''),
+                        room_type='lecture',
+                        duration=1,
+                        weekly_frequency=weekly_freq,
+                        priority=priority,
+                        is_heavy=subject.get('name', '').lower() in HEAVY_SUBJECTS
+                    )
+                    requirements.append(req)
+                
+                # Create class requirement for practical
+                if subject.get('practical_hours', 0) > 0:
+                    req = ClassRequirement(
+                        subject_id=subject.get('subject_id', '') + '_lab',
+                        subject_name=subject.get('name', '') + ' Lab',
+                        faculty_id=subject.get('faculty_id', ''),
+                        student_group_id=group.get('group_id', ''),
+                        room_type='lab',
+                        duration=2,  # Labs typically take 2 hours
+                        weekly_frequency=max(1, weekly_freq // 2),
+                        priority=priority
+                    )
+                    requirements.append(req)
+        
+        # Order by priority (HIGH -> MEDIUM -> LOW), then most constrained first
+        # (longer, more frequent classes), with deterministic ID tiebreakers
+        requirements.sort(key=lambda r: (
+            r.priority.value, -r.duration, -r.weekly_frequency, r.faculty_id, r.subject_id
+        ))
         
         return requirements
     
-    async def _parse_room_data(self, request_data: Dict[str, Any]) -> Dict[str, List[Dict]]:
+    def _parse_room_data(self, request_data: Dict[str, Any]) -> Dict[str, List[Dict]]:
         """Parse available rooms by type"""
         rooms = request_data.get('rooms', [])
         
@@ -165,9 +247,13 @@ class GreedyScheduler:
             if room_type in rooms_by_type:
                 rooms_by_type[room_type].append(room)
         
+        for room_type, rooms_of_type in rooms_by_type.items():
+            self.room_ids[room_type] = np.array([room['room_id'] for room in rooms_of_type], dtype=object)
+            self.room_caps[room_type] = np.array([room.get('capacity', 100) for room in rooms_of_type], dtype=np.int32)
+        
         return rooms_by_type
     
-    async def _parse_faculty_constraints(self, request_data: Dict[str, Any]) -> Dict[str, SchedulingConstraint]:
+    def _parse_faculty_constraints(self, request_data: Dict[str, Any]) -> Dict[str, SchedulingConstraint]:
         """Parse faculty constraints and preferences"""
         constraints = {}
         
@@ -179,16 +265,17 @@ class GreedyScheduler:
             # Parse unavailable slots
             unavailable = set()
             for slot_str in faculty.get('unavailable_slots', []):
-                # Parse slot string like "Monday_2" to TimeSlot
+                # Parse slot string like "Monday_2" to a packed slot (periods outside the day never clash)
                 if '_' in slot_str:
                     day_name, period = slot_str.split('_')
-                    day_idx = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday'].index(day_name.lower())
-                    unavailable.add(TimeSlot(day_idx, int(period)))
+                    day_idx = DAY_INDEX[day_name.lower()]
+                    if 0 <= int(period) < self.periods_per_day:
+                        unavailable.add(day_idx * self.periods_per_day + int(period))
             
             # Parse preferred days
             preferred_days = []
             for day_name in faculty.get('preferred_days', []):
-                day_idx = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday'].index(day_name.lower())
+                day_idx = DAY_INDEX[day_name.lower()]
                 preferred_days.append(day_idx)
             
             constraint = SchedulingConstraint(
@@ -203,21 +290,6 @@ class GreedyScheduler:
         
         return constraints
     
-    def _group_needs_subject(self, group: Dict, subject: Dict) -> bool:
-        """Check if a student group needs a particular subject"""
-        # Check program compatibility
-        group_program = group.get('program', '').lower()
-        subject_programs = [p.lower() for p in subject.get('programs', [])]
-        
-        if subject_programs and group_program not in subject_programs:
-            return False
-        
-        # Check semester compatibility
-        group_semester = group.get('semester', 0)
-        subject_semester = subject.get('semester', 0)
-        
-        return group_semester == subject_semester
-    
     def _determine_subject_priority(self, subject: Dict) -> Priority:
         """Determine scheduling priority based on NEP 2020 subject type"""
         subject_type = subject.get('type', '').lower()
@@ -234,7 +306,7 @@ class GreedyScheduler:
         else:
             return Priority.LOW
     
-    async def _schedule_classes_greedily(
+    def _schedule_classes_greedily(
         self, 
         requirements: List[ClassRequirement],
         available_rooms: Dict[str, List[Dict]]
@@ -247,10 +319,11 @@ class GreedyScheduler:
             # Schedule based on weekly frequency
             for occurrence in range(req.weekly_frequency):
                 # Find best available slot
-                best_slot = await self._find_best_slot(req, available_rooms)
+                best_slot = self._find_best_slot(req, available_rooms)
                 
                 if best_slot:
                     slot, room = best_slot
+                    day, period = divmod(slot, self.periods_per_day)
                     
                     # Allocate the slot
                     class_info = {
@@ -260,9 +333,9 @@ class GreedyScheduler:
                         'student_group_id': req.student_group_id,
                         'room_id': room['room_id'],
                         'room_name': room.get('name', room['room_id']),
-                        'day': slot.day,
-                        'period': slot.period,
-                        'time_slot': self.time_slots[slot.period],
+                        'day': day,
+                        'period': period,
+                        'time_slot': self.time_slots[period],
                         'duration': req.duration
                     }
                     
@@ -275,241 +348,214 @@ class GreedyScheduler:
         
         return scheduled_classes
     
-    async def _find_best_slot(
+    def _find_best_slot(
         self, 
         req: ClassRequirement,
         available_rooms: Dict[str, List[Dict]]
-    ) -> Optional[Tuple[TimeSlot, Dict]]:
+    ) -> Optional[Tuple[int, Dict]]:
         """Find the best available time slot for a class using greedy heuristics"""
         
-        candidate_slots = []
-        rooms_of_type = available_rooms.get(req.room_type, [])
+        rooms_of_type = available_rooms.get(req.room_type, ())
         
-        if not rooms_of_type:
+        # Only start periods where the duration fits
+        n_starts = self.periods_per_day - req.duration + 1
+        if not rooms_of_type or n_starts <= 0:
             return None
         
-        # Generate all possible slots
-        for day in range(self.days):
-            for period in range(self.periods_per_day):
-                slot = TimeSlot(day, period)
-                
-                # Check if duration fits
-                if period + req.duration > self.periods_per_day:
-                    continue
-                
-                # Try each room
-                for room in rooms_of_type:
-                    score = await self._evaluate_slot(slot, req, room)
-                    
-                    if score > 0:  # Valid slot
-                        heapq.heappush(candidate_slots, (-score, slot, room))
+        # Score every (day, start period, room) candidate at once
+        scores = self._score_slots(req, n_starts)
         
-        # Return best slot if available
-        if candidate_slots:
-            _, best_slot, best_room = heapq.heappop(candidate_slots)
-            return (best_slot, best_room)
+        # First highest-scoring valid candidate in (day, period, room) order
+        best = int(scores.argmax())
+        if scores.flat[best] <= 0:
+            return None
         
-        return None
+        day, period, room_idx = np.unravel_index(best, scores.shape)
+        return (int(day) * self.periods_per_day + int(period), rooms_of_type[room_idx])
     
-    async def _evaluate_slot(
+    def _score_slots(
         self,
-        slot: TimeSlot,
         req: ClassRequirement,
-        room: Dict
-    ) -> float:
-        """Evaluate how good a slot is for a requirement (higher score is better)"""
+        n_starts: int
+    ) -> np.ndarray:
+        """Score a requirement on the (day, start period, room) grid; 0 marks invalid slots"""
+        constraint = self.constraints.get(req.faculty_id)
+        faculty_idx = self.faculty_index[req.faculty_id]
+        group_idx = self.group_index[req.student_group_id]
+        
+        periods = np.arange(n_starts)
+        dmasks = ((1 << req.duration) - 1) << periods  # (n_starts,) bitmask per start period
+        
+        # Hard constraints: faculty (busy or unavailable), group and room availability
+        # combined into one busy mask per (day, room)
+        blocked = (
+            self.faculty_masks[faculty_idx] |
+            self.faculty_unavailable[faculty_idx] |
+            self.group_masks[group_idx]
+        )[:, None] | self.room_masks[self.room_rows[req.room_type]].T  # (days, n_rooms)
+        valid = (blocked[:, None, :] & dmasks[None, :, None]) == 0  # (days, n_starts, n_rooms)
+        
+        # Nothing can be placed: skip the soft-constraint scoring entirely
+        if not valid.any():
+            return np.zeros(valid.shape)
         
         # Start with base score
-        score = 100.0
-        
-        # Check hard constraints (if violated, return 0)
-        if not self._check_hard_constraints(slot, req, room):
-            return 0
+        scores = np.full((self.days, n_starts), 100.0)
         
         # Soft constraint: Preferred slots
-        if req.preferred_slots and slot in req.preferred_slots:
-            score += 50
-        
-        # Soft constraint: Faculty preferences
-        if req.faculty_id in self.constraints:
-            constraint = self.constraints[req.faculty_id]
-            
-            # Preferred days bonus
-            if constraint.preferred_days and slot.day in constraint.preferred_days:
-                score += 20
-            
-            # Check consecutive hours
-            consecutive_penalty = self._calculate_consecutive_penalty(slot, req.faculty_id, constraint)
-            score -= consecutive_penalty
-            
-            # Check gap requirements
-            gap_penalty = self._calculate_gap_penalty(slot, req.faculty_id, constraint)
-            score -= gap_penalty
-        
-        # Green optimization: Minimize faculty movement
-        movement_penalty = self._calculate_movement_penalty(slot, req.faculty_id, room)
-        score -= movement_penalty
+        for preferred_slot in req.preferred_slots:
+            day, period = divmod(preferred_slot, self.periods_per_day)
+            if 0 <= day < self.days and period < n_starts:
+                scores[day, period] += 50
         
         # Fatigue optimization: Avoid heavy subjects in afternoon/evening
-        if req.subject_name.lower() in ['mathematics', 'physics', 'chemistry']:
-            if slot.period >= 5:  # After 2 PM
-                score -= 30
+        if req.is_heavy:
+            scores[:, 5:] -= 30  # After 2 PM
         
         # Balance distribution across week
-        day_load = len([s for s in self.group_schedule[req.student_group_id] if s.day == slot.day])
-        if day_load > 4:  # Too many classes in one day
-            score -= day_load * 10
+        day_load = self.group_day_count[group_idx]
+        scores -= np.where(day_load > 4, day_load * 10, 0)[:, None]  # Too many classes in one day
         
         # Room capacity matching
-        room_capacity = room.get('capacity', 100)
         # Ideally we'd check group size, but using a simple heuristic
-        if room_capacity < 30:  # Small room
-            score -= 10
+        room_scores = scores[:, :, None] - np.where(self.room_caps[req.room_type] < 30, 10, 0)
         
-        return max(0, score)
+        # Faculty preferences and movement
+        room_scores += self._faculty_score_terms(req, constraint, faculty_idx, n_starts)
+        
+        return np.where(valid, np.maximum(room_scores, 0), 0)
     
-    def _check_hard_constraints(
+    def _faculty_score_terms(
         self,
-        slot: TimeSlot,
         req: ClassRequirement,
-        room: Dict
-    ) -> bool:
-        """Check if hard constraints are satisfied"""
+        constraint: Optional[SchedulingConstraint],
+        faculty_idx: int,
+        n_starts: int
+    ) -> np.ndarray:
+        """Faculty-dependent score adjustments per (day, start period, room), memoized"""
+        
+        # These terms only change when the faculty's occupancy does, so the
+        # current day masks are part of the key
+        faculty_masks = self.faculty_masks[faculty_idx]
+        cache_key = (faculty_idx, faculty_masks.tobytes(), n_starts, req.room_type)
+        terms = self._faculty_terms_cache.get(cache_key)
+        if terms is not None:
+            return terms
+        
+        periods = np.arange(n_starts)
+        day_terms = np.zeros((self.days, n_starts))
         
-        # Check if slot duration is available
-        for i in range(req.duration):
-            check_slot = TimeSlot(slot.day, slot.period + i)
-            
-            # Faculty availability
-            if check_slot in self.faculty_schedule[req.faculty_id]:
-                return False
+        # Soft constraint: Faculty preferences
+        if constraint is not None:
+            faculty_busy = ((faculty_masks[:, None] >> np.arange(self.periods_per_day)) & 1).astype(bool)
             
-            # Room availability
-            if check_slot in self.room_schedule[room['room_id']]:
-                return False
+            # Preferred days bonus
+            for day in constraint.preferred_day_set:
+                if 0 <= day < self.days:
+                    day_terms[day] += 20
             
-            # Student group availability
-            if check_slot in self.group_schedule[req.student_group_id]:
-                return False
+            # Check consecutive hours
+            day_terms -= self._consecutive_penalties(faculty_busy, constraint, periods)
             
-            # Check faculty unavailability constraints
-            if req.faculty_id in self.constraints:
-                if check_slot in self.constraints[req.faculty_id].unavailable_slots:
-                    return False
+            # Check gap requirements
+            day_terms -= self._gap_penalties(faculty_busy, constraint, periods)
+        
+        # Green optimization: Minimize faculty movement
+        terms = day_terms[:, :, None] - self._movement_penalties(req.faculty_id, faculty_idx, self.room_ids[req.room_type], n_starts)
         
-        return True
+        self._faculty_terms_cache[cache_key] = terms
+        return terms
     
-    def _calculate_consecutive_penalty(
+    def _consecutive_penalties(
         self,
-        slot: TimeSlot,
-        faculty_id: str,
-        constraint: SchedulingConstraint
-    ) -> float:
-        """Calculate penalty for too many consecutive hours"""
-        
-        # Count consecutive hours before and after this slot
-        consecutive = 1
-        
-        # Check before
-        for i in range(1, constraint.max_consecutive_hours):
-            check_slot = TimeSlot(slot.day, slot.period - i)
-            if check_slot in self.faculty_schedule[faculty_id]:
-                consecutive += 1
-            else:
-                break
-        
-        # Check after
-        for i in range(1, constraint.max_consecutive_hours):
-            check_slot = TimeSlot(slot.day, slot.period + i)
-            if check_slot in self.faculty_schedule[faculty_id]:
-                consecutive += 1
-            else:
-                break
+        faculty_busy: np.ndarray,
+        constraint: SchedulingConstraint,
+        periods: np.ndarray
+    ) -> np.ndarray:
+        """Penalty per (day, start period) for too many consecutive hours"""
+        
+        # Count consecutive hours before and after each slot
+        consecutive = np.ones((self.days, len(periods)), dtype=np.int64)
+        for direction in (-1, 1):
+            run = np.ones_like(consecutive, dtype=bool)
+            for i in range(1, constraint.max_consecutive_hours):
+                neighbour = periods + direction * i
+                in_day = (neighbour >= 0) & (neighbour < self.periods_per_day)
+                run &= in_day & faculty_busy[:, np.clip(neighbour, 0, self.periods_per_day - 1)]
+                consecutive += run
         
         # Penalty if exceeds max consecutive hours
-        if consecutive > constraint.max_consecutive_hours:
-            return (consecutive - constraint.max_consecutive_hours) * 20
-        
-        return 0
+        return np.maximum(consecutive - constraint.max_consecutive_hours, 0) * 20
     
-    def _calculate_gap_penalty(
+    def _gap_penalties(
         self,
-        slot: TimeSlot,
-        faculty_id: str,
-        constraint: SchedulingConstraint
-    ) -> float:
-        """Calculate penalty for not meeting gap requirements"""
+        faculty_busy: np.ndarray,
+        constraint: SchedulingConstraint,
+        periods: np.ndarray
+    ) -> np.ndarray:
+        """Penalty per (day, start period) for not meeting gap requirements"""
         
         if constraint.min_gap_between_classes == 0:
             return 0
         
-        # Find nearest class for this faculty on same day
-        faculty_slots_today = [
-            s for s in self.faculty_schedule[faculty_id] 
-            if s.day == slot.day
-        ]
+        # Distance to the nearest class for this faculty on the same day
+        distance = np.abs(periods[:, None] - np.arange(self.periods_per_day)[None, :])
+        min_distance = np.where(faculty_busy[:, None, :], distance[None, :, :], self.periods_per_day).min(axis=2)
         
-        if not faculty_slots_today:
-            return 0
-        
-        min_distance = float('inf')
-        for existing_slot in faculty_slots_today:
-            distance = abs(existing_slot.period - slot.period)
-            min_distance = min(min_distance, distance)
-        
-        # Penalty if gap is too small
-        if min_distance < constraint.min_gap_between_classes:
-            return 15
-        
-        return 0
+        # Penalty if gap is too small; days without classes never qualify,
+        # whatever the sentinel distance
+        has_classes = faculty_busy.any(axis=1)[:, None]
+        return np.where(has_classes & (min_distance < constraint.min_gap_between_classes), 15, 0)
     
-    def _calculate_movement_penalty(
+    def _movement_penalties(
         self,
-        slot: TimeSlot,
         faculty_id: str,
-        room: Dict
-    ) -> float:
-        """Calculate penalty for faculty movement between rooms"""
-        
-        # Find adjacent classes for this faculty
-        prev_slot = TimeSlot(slot.day, slot.period - 1)
-        next_slot = TimeSlot(slot.day, slot.period + 1)
-        
-        penalty = 0
+        faculty_idx: int,
+        room_ids: np.ndarray,
+        n_starts: int
+    ) -> np.ndarray:
+        """Penalty per (day, start period, room) for faculty movement between rooms"""
+        penalties = np.zeros((self.days, n_starts, len(room_ids)))
         
         # Check if faculty has classes immediately before or after
-        for existing_slot in self.faculty_schedule[faculty_id]:
-            if existing_slot == prev_slot or existing_slot == next_slot:
+        for day, mask in enumerate(self.faculty_masks[faculty_idx].tolist()):
+            for period in range(self.periods_per_day):
+                if not mask >> period & 1:
+                    continue
+                
                 # Find room of existing class
-                existing_room = self._get_room_for_slot(faculty_id, existing_slot)
-                if existing_room and existing_room != room['room_id']:
-                    penalty += 25  # Penalty for room change
+                existing_room = self.faculty_slot_room.get((faculty_id, day * self.periods_per_day + period))
+                if not existing_room:
+                    continue
+                
+                for start in (period - 1, period + 1):
+                    if 0 <= start < n_starts:
+                        penalties[day, start] += np.where(room_ids != existing_room, 25, 0)  # Penalty for room change
         
-        return penalty
-    
-    def _get_room_for_slot(self, faculty_id: str, slot: TimeSlot) -> Optional[str]:
-        """Get room ID for a faculty's class at given slot"""
-        # This would need to track room assignments
-        # Simplified implementation
-        return None
+        return penalties
     
     def _allocate_slot(
         self,
-        slot: TimeSlot,
+        slot: int,
         req: ClassRequirement,
         room: Dict
     ):
-        """Allocate a time slot for a class"""
+        """Allocate a (packed) time slot for a class"""
         
         # Mark slots as occupied for duration
-        for i in range(req.duration):
-            occupied_slot = TimeSlot(slot.day, slot.period + i)
-            
-            self.faculty_schedule[req.faculty_id].add(occupied_slot)
-            self.room_schedule[room['room_id']].add(occupied_slot)
-            self.group_schedule[req.student_group_id].add(occupied_slot)
+        day, period = divmod(slot, self.periods_per_day)
+        dmask = _dmask(period, req.duration)
+        
+        self.faculty_masks[self.faculty_index[req.faculty_id], day] |= dmask
+        self.room_masks[self.room_index[room['room_id']], day] |= dmask
+        self.group_masks[self.group_index[req.student_group_id], day] |= dmask
+        self.group_day_count[self.group_index[req.student_group_id], day] += req.duration
+        
+        # Remember where the faculty teaches, for movement penalties
+        for occupied_slot in range(slot, slot + req.duration):
+            self.faculty_slot_room[(req.faculty_id, occupied_slot)] = room['room_id']
     
-    async def _generate_schedule_output(self, scheduled_classes: List[Dict]) -> Dict[str, Any]:
+    def _generate_schedule_output(self, scheduled_classes: List[Dict]) -> Dict[str, Any]:
         """Generate final schedule output format"""
         
         schedule = {
@@ -1,25 +1,33 @@
 # main.py - FastAPI Backend for NEP Schedulers
-from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import pandas as pd
-import numpy as np
-import json
+import orjson
 import uuid
-from datetime import datetime, timedelta
+import hashlib
+import dataclasses
+from datetime import datetime
 import asyncio
-import redis
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import redis.asyncio as aioredis
+import msgpack
+import zlib
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import os
+import io
+import re
+import threading
+from contextlib import contextmanager
+from functools import cached_property
 from genetic_algorithm import GeneticScheduler
 from greedy_algorithm import GreedyScheduler
 from conflict_resolver import ConflictResolver
 from nep_compliance import NEPComplianceChecker
 
-app = FastAPI(title="NEP Schedulers API", version="1.0.0")
+app = FastAPI(title="NEP Schedulers API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -31,16 +39,62 @@ app.add_middleware(
 )
 
 # Redis connection
-redis_client = redis.Redis(host='localhost', port=6379, db=0)
-
-# Database connection
+redis_client = aioredis.Redis(host='localhost', port=6379, db=0)
+
+# Dataclass values (e.g. conflict records) are cached as plain dicts
+def pack_default(obj: Any) -> Any:
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Cannot cache object of type {type(obj).__name__}")
+
+# Cached schedules are msgpack, compressed at a fast level to cut Redis memory and traffic
+def pack_schedule(result: Dict[str, Any]) -> bytes:
+    return zlib.compress(msgpack.packb(result, default=pack_default), 3)
+
+def unpack_schedule(payload: bytes) -> Dict[str, Any]:
+    return msgpack.unpackb(zlib.decompress(payload))
+
+# Database connection pool, created on first use
+db_pool: Optional[ThreadedConnectionPool] = None
+db_pool_lock = threading.Lock()
+
+def get_db_pool() -> ThreadedConnectionPool:
+    global db_pool
+    with db_pool_lock:
+        if db_pool is None:
+            db_pool = ThreadedConnectionPool(
+                minconn=1,
+                maxconn=10,
+                host=os.getenv("DB_HOST", "localhost"),
+                database=os.getenv("DB_NAME", "nep_scheduler"),
+                user=os.getenv("DB_USER", "postgres"),
+                password=os.getenv("DB_PASSWORD", "password")
+            )
+    return db_pool
+
+@contextmanager
 def get_db_connection():
-    return psycopg2.connect(
-        host=os.getenv("DB_HOST", "localhost"),
-        database=os.getenv("DB_NAME", "nep_scheduler"),
-        user=os.getenv("DB_USER", "postgres"),
-        password=os.getenv("DB_PASSWORD", "password")
-    )
+    """Borrow a pooled connection, committing on success and rolling back on error"""
+    pool = get_db_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+@app.on_event("shutdown")
+def close_db_pool():
+    if db_pool is not None:
+        db_pool.closeall()
+
+# Uvicorn worker processes serving the app
+SERVER_WORKERS = min(4, os.cpu_count() or 1)
 
 # Pydantic Models
 class TimetableRequest(BaseModel):
@@ -81,16 +135,29 @@ class Subject(BaseModel):
 
 # AI Scheduling Engine
 class AISchedulingEngine:
-    def __init__(self):
-        self.greedy_scheduler = GreedyScheduler()
-        self.genetic_scheduler = GeneticScheduler()
-        self.conflict_resolver = ConflictResolver()
-        self.nep_checker = NEPComplianceChecker()
+    # Schedulers are built on first use, so workers that never generate a
+    # timetable never pay for them
+    @cached_property
+    def greedy_scheduler(self) -> GreedyScheduler:
+        return GreedyScheduler()
+    
+    @cached_property
+    def genetic_scheduler(self) -> GeneticScheduler:
+        # Server workers split the CPUs between their fitness pools
+        return GeneticScheduler(max_workers=max(1, (os.cpu_count() or 1) // SERVER_WORKERS))
+    
+    @cached_property
+    def conflict_resolver(self) -> ConflictResolver:
+        return ConflictResolver()
+    
+    @cached_property
+    def nep_checker(self) -> NEPComplianceChecker:
+        return NEPComplianceChecker()
     
     async def generate_timetable(self, request: TimetableRequest):
         """Hybrid AI algorithm for timetable generation"""
         # Phase 1: Greedy Algorithm for initial placement
-        initial_schedule = await self.greedy_scheduler.generate_initial_schedule(request)
+        initial_schedule = await self.greedy_scheduler.generate_initial_schedule(request.model_dump())
         
         # Phase 2: Genetic Algorithm for optimization
         optimized_schedule = await self.genetic_scheduler.optimize_schedule(
@@ -101,7 +168,7 @@ class AISchedulingEngine:
         final_schedule = await self.conflict_resolver.resolve_conflicts(optimized_schedule)
         
         # Phase 4: NEP Compliance Check
-        compliance_report = await self.nep_checker.check_compliance(final_schedule)
+        compliance_report = self.nep_checker.check_compliance(final_schedule)
         
         return {
             "schedule": final_schedule,
@@ -123,6 +190,106 @@ class AISchedulingEngine:
 # Initialize AI Engine
 ai_engine = AISchedulingEngine()
 
+@app.on_event("shutdown")
+def close_genetic_pool():
+    # Only a scheduler that was actually built can own a worker pool
+    if 'genetic_scheduler' in ai_engine.__dict__:
+        ai_engine.genetic_scheduler.close()
+
+# ETag support for pre-encoded JSON payloads
+def etag_for(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def json_response_with_etag(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-encoded JSON body, or 304 if the client already holds this version"""
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+# Static analytics payloads (mock data), encoded once at import and served as-is
+CONFLICT_ANALYSIS_JSON = orjson.dumps({
+    "total_conflicts": 0,
+    "conflict_types": {
+        "faculty_overlap": 0,
+        "room_booking": 0,
+        "student_clash": 0
+    },
+    "heatmap": {
+        "monday": {"level": "low", "conflicts": 0},
+        "tuesday": {"level": "low", "conflicts": 0},
+        "wednesday": {"level": "medium", "conflicts": 2},
+        "thursday": {"level": "low", "conflicts": 0},
+        "friday": {"level": "high", "conflicts": 4}
+    },
+    "resolution_suggestions": []
+})
+CONFLICT_ANALYSIS_ETAG = etag_for(CONFLICT_ANALYSIS_JSON)
+
+AUTO_REALLOCATION_JSON = orjson.dumps({
+    "status": "success",
+    "reallocation": {
+        "original_affected_slots": 3,
+        "new_allocations": [
+            {"slot": "Monday 10:00-11:00", "new_room": "Room 205", "new_faculty": "Dr. Alternative"},
+            {"slot": "Wednesday 14:00-15:00", "new_room": "Lab 302", "status": "rescheduled"},
+            {"slot": "Friday 09:00-10:00", "action": "moved to online mode"}
+        ],
+        "impact_assessment": {
+            "students_affected": 45,
+            "faculty_notified": 8,
+            "rooms_reallocated": 2
+        },
+        "success_rate": "100%"
+    },
+    "message": "Auto-reallocation completed successfully"
+})
+
+NEP_COMPLIANCE_JSON = orjson.dumps({
+    "overall_score": 96,
+    "major_courses": {"percentage": 100, "status": "compliant"},
+    "minor_courses": {"percentage": 95, "status": "compliant"},
+    "skill_courses": {"percentage": 98, "status": "compliant"},
+    "value_added_courses": {"percentage": 92, "status": "needs_attention"},
+    "multidisciplinary_ratio": 87,
+    "credit_distribution": {
+        "theory": 65,
+        "practical": 25,
+        "internship": 10
+    },
+    "recommendations": [
+        "Increase value-added course allocation by 3%",
+        "Balance theory-practical ratio in Semester 3"
+    ]
+})
+NEP_COMPLIANCE_ETAG = etag_for(NEP_COMPLIANCE_JSON)
+
+UTILIZATION_ANALYTICS_JSON = orjson.dumps({
+    "faculty": {
+        "average_utilization": 87,
+        "underutilized": ["Dr. Smith (65%)", "Prof. Johnson (72%)"],
+        "overutilized": ["Dr. Brown (95%)", "Prof. Davis (92%)"],
+        "optimal_range": "75-85%"
+    },
+    "rooms": {
+        "average_utilization": 92,
+        "peak_hours": ["10:00-12:00", "14:00-16:00"],
+        "underutilized_rooms": ["Seminar Hall 3", "Lab 405"],
+        "booking_efficiency": 88
+    },
+    "labs": {
+        "average_utilization": 78,
+        "equipment_usage": 82,
+        "maintenance_slots": 6
+    },
+    "recommendations": [
+        "Redistribute Dr. Brown's load to Dr. Smith",
+        "Utilize Seminar Hall 3 for overflow classes",
+        "Schedule lab maintenance during low-usage hours"
+    ]
+})
+UTILIZATION_ANALYTICS_ETAG = etag_for(UTILIZATION_ANALYTICS_JSON)
+
 # API Endpoints
 @app.get("/")
 async def root():
@@ -139,29 +306,26 @@ async def upload_data(
     uploaded_data = {}
     
     try:
-        if student_file:
-            content = await student_file.read()
-            df = pd.read_excel(content) if student_file.filename.endswith('.xlsx') else pd.read_csv(content)
-            uploaded_data['students'] = df.to_dict('records')
-            
-        if faculty_file:
-            content = await faculty_file.read()
-            df = pd.read_excel(content) if faculty_file.filename.endswith('.xlsx') else pd.read_csv(content)
-            uploaded_data['faculty'] = df.to_dict('records')
-            
-        if subject_file:
-            content = await subject_file.read()
-            df = pd.read_excel(content) if subject_file.filename.endswith('.xlsx') else pd.read_csv(content)
-            uploaded_data['subjects'] = df.to_dict('records')
-            
-        if room_file:
-            content = await room_file.read()
-            df = pd.read_excel(content) if room_file.filename.endswith('.xlsx') else pd.read_csv(content)
-            uploaded_data['rooms'] = df.to_dict('records')
+        upload_files = {
+            'students': student_file,
+            'faculty': faculty_file,
+            'subjects': subject_file,
+            'rooms': room_file
+        }
+        
+        # Parse straight from the spooled uploads in worker threads, concurrently,
+        # so large spreadsheets neither get buffered twice nor block the event loop
+        provided = {key: upload_file for key, upload_file in upload_files.items() if upload_file}
+        frames = await asyncio.gather(
+            *(asyncio.to_thread(parse_upload, upload_file) for upload_file in provided.values())
+        )
+        uploaded_data.update(zip(provided, frames))
         
-        # Store in Redis for quick access
+        # Store in Redis for quick access, column-wise rather than one dict per row
         cache_key = f"uploaded_data_{uuid.uuid4()}"
-        redis_client.setex(cache_key, 3600, json.dumps(uploaded_data))
+        await redis_client.setex(
+            cache_key, 3600, msgpack.packb({key: df.to_dict('list') for key, df in uploaded_data.items()})
+        )
         
         # Store in PostgreSQL for persistence
         await store_data_in_db(uploaded_data)
@@ -180,16 +344,25 @@ async def upload_data(
 async def generate_timetable(request: TimetableRequest, background_tasks: BackgroundTasks):
     """Generate AI-optimized timetable"""
     try:
-        # Generate timetable using AI engine
-        result = await ai_engine.generate_timetable(request)
-        
-        # Cache the result
-        cache_key = f"timetable_{uuid.uuid4()}"
-        redis_client.setex(cache_key, 7200, json.dumps(result))
-        
-        # Schedule background tasks
-        background_tasks.add_task(update_analytics, result)
-        background_tasks.add_task(send_notifications, result)
+        # Identical requests are served from the cache keyed on their content
+        request_hash = hashlib.blake2b(
+            orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+        cache_key = f"timetable:{request_hash}"
+        
+        cached = await redis_client.get(cache_key)
+        if cached:
+            result = unpack_schedule(cached)
+        else:
+            # Generate timetable using AI engine
+            result = await ai_engine.generate_timetable(request)
+            
+            # Cache the result
+            await redis_client.setex(cache_key, 7200, pack_schedule(result))
+            
+            # Schedule background tasks
+            background_tasks.add_task(update_analytics, result)
+            background_tasks.add_task(send_notifications, result)
         
         return {
             "status": "success",
@@ -202,31 +375,10 @@ async def generate_timetable(request: TimetableRequest, background_tasks: Backgr
         raise HTTPException(status_code=500, detail=f"Timetable generation failed: {str(e)}")
 
 @app.get("/api/conflict-analysis")
-async def get_conflict_analysis():
+async def get_conflict_analysis(request: Request):
     """Get real-time conflict analysis and heatmap data"""
-    try:
-        # Mock conflict analysis - replace with actual logic
-        conflict_data = {
-            "total_conflicts": 0,
-            "conflict_types": {
-                "faculty_overlap": 0,
-                "room_booking": 0,
-                "student_clash": 0
-            },
-            "heatmap": {
-                "monday": {"level": "low", "conflicts": 0},
-                "tuesday": {"level": "low", "conflicts": 0},
-                "wednesday": {"level": "medium", "conflicts": 2},
-                "thursday": {"level": "low", "conflicts": 0},
-                "friday": {"level": "high", "conflicts": 4}
-            },
-            "resolution_suggestions": []
-        }
-        
-        return conflict_data
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Conflict analysis failed: {str(e)}")
+    # Mock conflict analysis - replace with actual logic
+    return json_response_with_etag(request, CONFLICT_ANALYSIS_JSON, CONFLICT_ANALYSIS_ETAG)
 
 @app.post("/api/auto-reallocate")
 async def auto_reallocate(
@@ -235,91 +387,17 @@ async def auto_reallocate(
     date: Optional[str] = None
 ):
     """AI-powered automatic reallocation for changes"""
-    try:
-        reallocation_data = {
-            "original_affected_slots": 3,
-            "new_allocations": [
-                {"slot": "Monday 10:00-11:00", "new_room": "Room 205", "new_faculty": "Dr. Alternative"},
-                {"slot": "Wednesday 14:00-15:00", "new_room": "Lab 302", "status": "rescheduled"},
-                {"slot": "Friday 09:00-10:00", "action": "moved to online mode"}
-            ],
-            "impact_assessment": {
-                "students_affected": 45,
-                "faculty_notified": 8,
-                "rooms_reallocated": 2
-            },
-            "success_rate": "100%"
-        }
-        
-        return {
-            "status": "success",
-            "reallocation": reallocation_data,
-            "message": "Auto-reallocation completed successfully"
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Auto-reallocation failed: {str(e)}")
+    return Response(content=AUTO_REALLOCATION_JSON, media_type="application/json")
 
 @app.get("/api/analytics/nep-compliance")
-async def get_nep_compliance():
+async def get_nep_compliance(request: Request):
     """Get NEP 2020 compliance analytics"""
-    try:
-        compliance_data = {
-            "overall_score": 96,
-            "major_courses": {"percentage": 100, "status": "compliant"},
-            "minor_courses": {"percentage": 95, "status": "compliant"},
-            "skill_courses": {"percentage": 98, "status": "compliant"},
-            "value_added_courses": {"percentage": 92, "status": "needs_attention"},
-            "multidisciplinary_ratio": 87,
-            "credit_distribution": {
-                "theory": 65,
-                "practical": 25,
-                "internship": 10
-            },
-            "recommendations": [
-                "Increase value-added course allocation by 3%",
-                "Balance theory-practical ratio in Semester 3"
-            ]
-        }
-        
-        return compliance_data
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Compliance analysis failed: {str(e)}")
+    return json_response_with_etag(request, NEP_COMPLIANCE_JSON, NEP_COMPLIANCE_ETAG)
 
 @app.get("/api/analytics/utilization")
-async def get_utilization_analytics():
+async def get_utilization_analytics(request: Request):
     """Get resource utilization analytics"""
-    try:
-        utilization_data = {
-            "faculty": {
-                "average_utilization": 87,
-                "underutilized": ["Dr. Smith (65%)", "Prof. Johnson (72%)"],
-                "overutilized": ["Dr. Brown (95%)", "Prof. Davis (92%)"],
-                "optimal_range": "75-85%"
-            },
-            "rooms": {
-                "average_utilization": 92,
-                "peak_hours": ["10:00-12:00", "14:00-16:00"],
-                "underutilized_rooms": ["Seminar Hall 3", "Lab 405"],
-                "booking_efficiency": 88
-            },
-            "labs": {
-                "average_utilization": 78,
-                "equipment_usage": 82,
-                "maintenance_slots": 6
-            },
-            "recommendations": [
-                "Redistribute Dr. Brown's load to Dr. Smith",
-                "Utilize Seminar Hall 3 for overflow classes",
-                "Schedule lab maintenance during low-usage hours"
-            ]
-        }
-        
-        return utilization_data
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Utilization analysis failed: {str(e)}")
+    return json_response_with_etag(request, UTILIZATION_ANALYTICS_JSON, UTILIZATION_ANALYTICS_ETAG)
 
 @app.post("/api/export/{format}")
 async def export_timetable(format: str, timetable_id: str):
@@ -329,25 +407,25 @@ async def export_timetable(format: str, timetable_id: str):
             raise HTTPException(status_code=400, detail="Format must be 'pdf' or 'excel'")
         
         # Retrieve timetable data from cache
-        timetable_data = redis_client.get(timetable_id)
-        if not timetable_data:
+        cached = await redis_client.get(timetable_id)
+        if not cached:
             raise HTTPException(status_code=404, detail="Timetable not found")
+        timetable_data = unpack_schedule(cached)
         
-        # Generate export file (mock implementation)
+        # Generate export in memory (mock implementation)
         filename = f"timetable_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
-        filepath = f"/tmp/{filename}"
         
         if format == "pdf":
             # Generate PDF using reportlab or similar
-            await generate_pdf_export(timetable_data, filepath)
+            buffer = await generate_pdf_export(timetable_data)
         else:
             # Generate Excel using openpyxl or similar
-            await generate_excel_export(timetable_data, filepath)
+            buffer = await generate_excel_export(timetable_data)
         
-        return FileResponse(
-            path=filepath,
-            filename=filename,
-            media_type='application/octet-stream'
+        return StreamingResponse(
+            buffer,
+            media_type='application/octet-stream',
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
         )
         
     except Exception as e:
@@ -390,32 +468,46 @@ async def whatsapp_webhook(message_data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Bot processing failed: {str(e)}")
 
 # Helper Functions
+def parse_upload(upload_file: UploadFile) -> pd.DataFrame:
+    """Parse an uploaded Excel/CSV file into a DataFrame"""
+    upload_file.file.seek(0)
+    if upload_file.filename.endswith('.xlsx'):
+        df = pd.read_excel(upload_file.file, engine='openpyxl')
+    else:
+        df = pd.read_csv(upload_file.file)
+    return df
+
 async def store_data_in_db(data):
     """Store uploaded data in PostgreSQL"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Store data in respective tables
+    # psycopg2 blocks, so the inserts run on a worker thread with a pooled connection
+    await asyncio.to_thread(write_data_to_db, data)
+
+def frame_rows(df: pd.DataFrame, columns: List[str]) -> List[tuple]:
+    """Row tuples of the given columns; missing columns and empty cells become NULL"""
+    subset = df.reindex(columns=columns).astype(object)
+    return list(subset.where(subset.notna(), None).itertuples(index=False, name=None))
+
+def write_data_to_db(data: Dict[str, pd.DataFrame]):
+    """Insert uploaded students and faculty in batches"""
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        # Store data in respective tables, one multi-row INSERT per page of rows
         if 'students' in data:
-            for student in data['students']:
-                cursor.execute(
-                    "INSERT INTO students (student_id, name, program, semester) VALUES (%s, %s, %s, %s) ON CONFLICT DO NOTHING",
-                    (student.get('student_id'), student.get('name'), student.get('program'), student.get('semester'))
-                )
+            rows = frame_rows(data['students'], ['student_id', 'name', 'program', 'semester'])
+            execute_values(
+                cursor,
+                "INSERT INTO students (student_id, name, program, semester) VALUES %s ON CONFLICT DO NOTHING",
+                rows,
+                page_size=1000
+            )
         
         if 'faculty' in data:
-            for faculty in data['faculty']:
-                cursor.execute(
-                    "INSERT INTO faculty (faculty_id, name, department, max_hours) VALUES (%s, %s, %s, %s) ON CONFLICT DO NOTHING",
-                    (faculty.get('faculty_id'), faculty.get('name'), faculty.get('department'), faculty.get('max_hours'))
-                )
-        
-        conn.commit()
-        
-    finally:
-        cursor.close()
-        conn.close()
+            rows = frame_rows(data['faculty'], ['faculty_id', 'name', 'department', 'max_hours'])
+            execute_values(
+                cursor,
+                "INSERT INTO faculty (faculty_id, name, department, max_hours) VALUES %s ON CONFLICT DO NOTHING",
+                rows,
+                page_size=1000
+            )
 
 async def update_analytics(timetable_data):
     """Background task to update analytics"""
@@ -427,17 +519,15 @@ async def send_notifications(timetable_data):
     # Send notifications via WhatsApp, email, SMS
     pass
 
-async def generate_pdf_export(data, filepath):
+async def generate_pdf_export(data) -> io.BytesIO:
     """Generate PDF export of timetable"""
     # Implementation using reportlab or similar
-    with open(filepath, 'w') as f:
-        f.write("PDF export placeholder")
+    return io.BytesIO(b"PDF export placeholder")
 
-async def generate_excel_export(data, filepath):
+async def generate_excel_export(data) -> io.BytesIO:
     """Generate Excel export of timetable"""
     # Implementation using openpyxl or similar
-    with open(filepath, 'w') as f:
-        f.write("Excel export placeholder")
+    return io.BytesIO(b"Excel export placeholder")
 
 def generate_personal_schedule(user_id: str, user_type: str):
     """Generate personalized schedule based on user type"""
@@ -483,19 +573,32 @@ def get_user_notifications(user_id: str):
         {"type": "reminder", "message": "Assignment submission due tomorrow"}
     ]
 
+# Bot command replies in precedence order, matched with one precompiled scan
+BOT_RESPONSES = {
+    "/timetable": "📅 Your today's schedule:\n09:00 - Math (Room 101)\n11:00 - Physics (Lab 201)\n14:00 - Chemistry (Lab 301)",
+    "/today": "📚 Today's Classes: 3\n⏰ Next: Physics Lab at 14:00\n🏢 Room: Lab 201",
+    "/room": "🏢 Available Rooms:\n✅ Room 205 (2:00-3:00 PM)\n✅ Lab 302 (3:00-4:00 PM)\n❌ Room 101 (Occupied)",
+    "/faculty": "👨‍🏫 Dr. Smith's Schedule:\n09:00 - Math (Room 101)\n15:00 - Advanced Math (Room 205)"
+}
+BOT_HELP = "🤖 Available commands:\n/timetable - Your schedule\n/today - Today's summary\n/room - Room availability\n/faculty - Faculty schedule"
+BOT_COMMAND_PATTERN = re.compile("|".join(map(re.escape, BOT_RESPONSES)))
+
 async def process_bot_command(user_phone: str, message: str):
     """Process WhatsApp bot commands"""
-    if "/timetable" in message:
-        return "📅 Your today's schedule:\n09:00 - Math (Room 101)\n11:00 - Physics (Lab 201)\n14:00 - Chemistry (Lab 301)"
-    elif "/today" in message:
-        return "📚 Today's Classes: 3\n⏰ Next: Physics Lab at 14:00\n🏢 Room: Lab 201"
-    elif "/room" in message:
-        return "🏢 Available Rooms:\n✅ Room 205 (2:00-3:00 PM)\n✅ Lab 302 (3:00-4:00 PM)\n❌ Room 101 (Occupied)"
-    elif "/faculty" in message:
-        return "👨‍🏫 Dr. Smith's Schedule:\n09:00 - Math (Room 101)\n15:00 - Advanced Math (Room 205)"
-    else:
-        return "🤖 Available commands:\n/timetable - Your schedule\n/today - Today's summary\n/room - Room availability\n/faculty - Faculty schedule"
+    commands = set(BOT_COMMAND_PATTERN.findall(message))
+    for command, response in BOT_RESPONSES.items():
+        if command in commands:
+            return response
+    return BOT_HELP
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop and httptools ship with uvicorn[standard]; workers need the import string
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=SERVER_WORKERS
+    )
\ No newline at end of file
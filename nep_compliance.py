@@ -1,7 +1,30 @@
 # nep_compliance.py - NEP 2020 Compliance Verification System
-from typing import Dict, List, Any
-from dataclasses import dataclass
-import asyncio
+from typing import Dict, List, Set, Tuple, Any
+from dataclasses import dataclass, field
+import numpy as np
+from collections import Counter
+from functools import lru_cache
+
+# Multidisciplinary score by number of distinct disciplines, capped at 3
+_MULTIDISC_SCORES = (0, 40, 70, 100)
+
+@lru_cache(maxsize=1024)
+def _classify_type(subject_type: str) -> Tuple[str, bool]:
+    """Lowercased subject type and whether it is an internship/project type"""
+    lowered = subject_type.lower()
+    return lowered, 'internship' in lowered
+
+@lru_cache(maxsize=1024)
+def _classify_teacher_education_type(subject_type: str) -> str:
+    """Teacher-education component a subject type belongs to"""
+    lowered = subject_type.lower()
+    if 'pedagogy' in lowered or 'teaching' in lowered:
+        return 'pedagogy'
+    if 'practical' in lowered or 'practicum' in lowered:
+        return 'practicum'
+    if 'elective' in lowered:
+        return 'electives'
+    return 'subject_knowledge'
 
 @dataclass
 class NEPRequirement:
@@ -11,60 +34,105 @@ class NEPRequirement:
     max_percentage: float
     min_credits: int
     description: str
+    
+    # Report strings, formatted once per requirement
+    required_range: str = field(init=False, repr=False)
+    below_min_template: str = field(init=False, repr=False)
+    increase_template: str = field(init=False, repr=False)
+    above_max_template: str = field(init=False, repr=False)
+    reduce_template: str = field(init=False, repr=False)
+    low_credits_template: str = field(init=False, repr=False)
+    add_credits_template: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        title = self.category.title()
+        self.required_range = f"{self.min_percentage}-{self.max_percentage}%"
+        self.below_min_template = f"{title} courses are below minimum requirement ({{:.1f}}% < {self.min_percentage}%)"
+        self.increase_template = f"Increase {self.category} course allocation by {{:.1f}}%"
+        self.above_max_template = f"{title} courses exceed maximum limit ({{:.1f}}% > {self.max_percentage}%)"
+        self.reduce_template = f"Reduce {self.category} course allocation by {{:.1f}}%"
+        self.low_credits_template = f"{title} credits are insufficient ({{}} < {self.min_credits})"
+        self.add_credits_template = f"Add {{}} more credits in {self.category} courses"
+
+@dataclass
+class ComplianceTally:
+    """Category and violation counts the compliance score is computed from, kept in both report modes"""
+    compliant_categories: int = 0
+    total_categories: int = 0
+    violations: int = 0
 
 class NEPComplianceChecker:
     """Verify NEP 2020 compliance for timetables"""
     
-    def __init__(self):
-        # NEP 2020 requirements for Four-Year Undergraduate Programme (FYUP)
-        self.nep_requirements = {
-            'major': NEPRequirement(
-                category='major',
-                min_percentage=40,
-                max_percentage=50,
-                min_credits=64,
-                description='Major discipline courses'
-            ),
-            'minor': NEPRequirement(
-                category='minor',
-                min_percentage=20,
-                max_percentage=30,
-                min_credits=32,
-                description='Minor discipline courses'
-            ),
-            'skill': NEPRequirement(
-                category='skill',
-                min_percentage=10,
-                max_percentage=20,
-                min_credits=16,
-                description='Skill-based courses'
-            ),
-            'ability_enhancement': NEPRequirement(
-                category='ability_enhancement',
-                min_percentage=8,
-                max_percentage=15,
-                min_credits=12,
-                description='Ability Enhancement Courses'
-            ),
-            'value_added': NEPRequirement(
-                category='value_added',
-                min_percentage=5,
-                max_percentage=15,
-                min_credits=8,
-                description='Value-Added Courses'
-            )
-        }
-        
-        # B.Ed. and M.Ed. requirements
-        self.teacher_education_requirements = {
-            'pedagogy': 30,  # minimum percentage
-            'subject_knowledge': 40,
-            'practicum': 20,
-            'electives': 10
-        }
+    # NEP 2020 requirements for Four-Year Undergraduate Programme (FYUP);
+    # shared by all checkers and built once per process
+    nep_requirements = {
+        'major': NEPRequirement(
+            category='major',
+            min_percentage=40,
+            max_percentage=50,
+            min_credits=64,
+            description='Major discipline courses'
+        ),
+        'minor': NEPRequirement(
+            category='minor',
+            min_percentage=20,
+            max_percentage=30,
+            min_credits=32,
+            description='Minor discipline courses'
+        ),
+        'skill': NEPRequirement(
+            category='skill',
+            min_percentage=10,
+            max_percentage=20,
+            min_credits=16,
+            description='Skill-based courses'
+        ),
+        'ability_enhancement': NEPRequirement(
+            category='ability_enhancement',
+            min_percentage=8,
+            max_percentage=15,
+            min_credits=12,
+            description='Ability Enhancement Courses'
+        ),
+        'value_added': NEPRequirement(
+            category='value_added',
+            min_percentage=5,
+            max_percentage=15,
+            min_credits=8,
+            description='Value-Added Courses'
+        )
+    }
+    
+    # Position of each NEP category in the per-category tallies
+    _category_index = {category: i for i, category in enumerate(nep_requirements)}
+    
+    # The same requirements as parallel arrays, so all categories are checked at once
+    _nep_min_pct = np.array([r.min_percentage for r in nep_requirements.values()], dtype=np.float64)
+    _nep_max_pct = np.array([r.max_percentage for r in nep_requirements.values()], dtype=np.float64)
+    _nep_min_credits = np.array([r.min_credits for r in nep_requirements.values()], dtype=np.int64)
+    _nep_min_pct.setflags(write=False)
+    _nep_max_pct.setflags(write=False)
+    _nep_min_credits.setflags(write=False)
     
-    async def check_compliance(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
-        """Main method to check NEP 2020 compliance"""
+    # B.Ed. and M.Ed. requirements
+    teacher_education_requirements = {
+        'pedagogy': 30,  # minimum percentage
+        'subject_knowledge': 40,
+        'practicum': 20,
+        'electives': 10
+    }
+    
+    # Compliance check method for each supported program type
+    _HANDLERS = {
+        'FYUP': '_check_fyup_compliance',
+        'ITEP': '_check_fyup_compliance',
+        'B.Ed.': '_check_teacher_education_compliance',
+        'M.Ed.': '_check_teacher_education_compliance'
+    }
+    
+    def check_compliance(self, schedule: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
+        """Main method to check NEP 2020 compliance; verbose=False returns a score-only report"""
         
         compliance_report = {
             'overall_compliant': True,
@@ -75,197 +143,245 @@ class NEPComplianceChecker:
             'credit_distribution': {},
             'multidisciplinary_score': 0
         }
+        tally = ComplianceTally()
         
         # Extract schedule metadata
         program_type = schedule.get('program_type', 'FYUP')
         
-        if program_type in ['FYUP', 'ITEP']:
-            compliance_report = await self._check_fyup_compliance(schedule, compliance_report)
-        elif program_type in ['B.Ed.', 'M.Ed.']:
-            compliance_report = await self._check_teacher_education_compliance(schedule, compliance_report)
+        # Unknown program types have no category checks
+        handler = self._HANDLERS.get(program_type)
+        if handler is not None:
+            compliance_report = getattr(self, handler)(schedule, compliance_report, tally, verbose)
         
         # Calculate overall compliance score
-        compliance_report['compliance_score'] = self._calculate_overall_score(compliance_report)
+        compliance_report['compliance_score'] = self._calculate_overall_score(
+            tally, compliance_report['multidisciplinary_score']
+        )
         
         return compliance_report
     
-    async def _check_fyup_compliance(
+    def _check_fyup_compliance(
         self,
         schedule: Dict[str, Any],
-        report: Dict[str, Any]
+        report: Dict[str, Any],
+        tally: ComplianceTally,
+        verbose: bool = True
     ) -> Dict[str, Any]:
         """Check compliance for Four-Year Undergraduate Programme"""
         
+        # Collect all subject totals in a single pass
+        aggregate = self._aggregate(schedule)
+        
         # Extract course distribution
-        course_distribution = await self._analyze_course_distribution(schedule)
+        percentages, credits = self._analyze_course_distribution(aggregate)
+        
+        # Check every NEP category with three vectorized comparisons;
+        # each failed bound or credit minimum is one violation
+        below_min = percentages < self._nep_min_pct
+        above_max = percentages > self._nep_max_pct
+        low_credits = credits < self._nep_min_credits
+        compliant = ~(below_min | above_max | low_credits)
+        tally.violations += int(
+            np.count_nonzero(below_min) + np.count_nonzero(above_max) + np.count_nonzero(low_credits)
+        )
         
-        # Check each NEP category
-        for category, requirement in self.nep_requirements.items():
-            category_data = course_distribution.get(category, {})
-            percentage = category_data.get('percentage', 0)
-            credits = category_data.get('credits', 0)
-            
-            is_compliant = (
-                percentage >= requirement.min_percentage and
-                percentage <= requirement.max_percentage and
-                credits >= requirement.min_credits
-            )
-            
-            report['category_compliance'][category] = {
-                'compliant': is_compliant,
-                'current_percentage': percentage,
-                'required_range': f"{requirement.min_percentage}-{requirement.max_percentage}%",
-                'current_credits': credits,
-                'minimum_credits': requirement.min_credits,
-                'description': requirement.description
-            }
-            
-            # Add violations if not compliant
-            if not is_compliant:
-                report['overall_compliant'] = False
-                
-                if percentage < requirement.min_percentage:
-                    report['violations'].append(
-                        f"{category.title()} courses are below minimum requirement "
-                        f"({percentage:.1f}% < {requirement.min_percentage}%)"
-                    )
-                    report['recommendations'].append(
-                        f"Increase {category} course allocation by "
-                        f"{requirement.min_percentage - percentage:.1f}%"
-                    )
-                
-                if percentage > requirement.max_percentage:
-                    report['violations'].append(
-                        f"{category.title()} courses exceed maximum limit "
-                        f"({percentage:.1f}% > {requirement.max_percentage}%)"
-                    )
-                    report['recommendations'].append(
-                        f"Reduce {category} course allocation by "
-                        f"{percentage - requirement.max_percentage:.1f}%"
-                    )
-                
-                if credits < requirement.min_credits:
-                    report['violations'].append(
-                        f"{category.title()} credits are insufficient "
-                        f"({credits} < {requirement.min_credits})"
-                    )
-                    report['recommendations'].append(
-                        f"Add {requirement.min_credits - credits} more credits "
-                        f"in {category} courses"
-                    )
+        requirements = list(self.nep_requirements.values())
+        tally.compliant_categories += int(np.count_nonzero(compliant))
+        tally.total_categories += len(requirements)
+        
+        # Per-category details are only built for verbose reports
+        if verbose:
+            for requirement, percentage, credit_total, is_compliant in zip(
+                requirements, percentages.tolist(), credits.tolist(), compliant.tolist()
+            ):
+                report['category_compliance'][requirement.category] = {
+                    'compliant': is_compliant,
+                    'current_percentage': percentage,
+                    'required_range': requirement.required_range,
+                    'current_credits': credit_total,
+                    'minimum_credits': requirement.min_credits,
+                    'description': requirement.description
+                }
+        
+        if not compliant.all():
+            report['overall_compliant'] = False
+        
+        if verbose:
+            self._describe_fyup_violations(report, requirements, percentages, credits, compliant)
         
         # Check multidisciplinary requirement
-        report['multidisciplinary_score'] = await self._calculate_multidisciplinary_score(schedule)
+        report['multidisciplinary_score'] = self._calculate_multidisciplinary_score(aggregate['disciplines'])
         
         if report['multidisciplinary_score'] < 70:
-            report['violations'].append(
-                f"Multidisciplinary exposure is low ({report['multidisciplinary_score']:.1f}%)"
-            )
-            report['recommendations'].append(
-                "Increase interdisciplinary course offerings across different faculties"
-            )
+            tally.violations += 1
+            if verbose:
+                report['violations'].append(
+                    f"Multidisciplinary exposure is low ({report['multidisciplinary_score']:.1f}%)"
+                )
+                report['recommendations'].append(
+                    "Increase interdisciplinary course offerings across different faculties"
+                )
         
         # Check theory-practical balance
-        theory_practical_ratio = await self._check_theory_practical_balance(schedule)
+        theory_practical_ratio = self._check_theory_practical_balance(
+            aggregate['theory_hours'], aggregate['practical_hours'], aggregate['internship_hours']
+        )
         report['credit_distribution'] = theory_practical_ratio
         
-        if theory_practical_ratio['practical_percentage'] < 20:
+        if verbose and theory_practical_ratio['practical_percentage'] < 20:
             report['recommendations'].append(
                 "Increase practical/lab components to at least 20% of total hours"
             )
         
         return report
     
-    async def _check_teacher_education_compliance(
+    def _describe_fyup_violations(
+        self,
+        report: Dict[str, Any],
+        requirements: List[NEPRequirement],
+        percentages: np.ndarray,
+        credits: np.ndarray,
+        compliant: np.ndarray
+    ):
+        """Add violation and recommendation messages for non-compliant NEP categories"""
+        
+        for idx in np.flatnonzero(~compliant).tolist():
+            requirement = requirements[idx]
+            percentage = float(percentages[idx])
+            credit_total = int(credits[idx])
+            
+            if percentage < requirement.min_percentage:
+                report['violations'].append(requirement.below_min_template.format(percentage))
+                report['recommendations'].append(
+                    requirement.increase_template.format(requirement.min_percentage - percentage)
+                )
+            
+            if percentage > requirement.max_percentage:
+                report['violations'].append(requirement.above_max_template.format(percentage))
+                report['recommendations'].append(
+                    requirement.reduce_template.format(percentage - requirement.max_percentage)
+                )
+            
+            if credit_total < requirement.min_credits:
+                report['violations'].append(requirement.low_credits_template.format(credit_total))
+                report['recommendations'].append(
+                    requirement.add_credits_template.format(requirement.min_credits - credit_total)
+                )
+    
+    def _check_teacher_education_compliance(
         self,
         schedule: Dict[str, Any],
-        report: Dict[str, Any]
+        report: Dict[str, Any],
+        tally: ComplianceTally,
+        verbose: bool = True
     ) -> Dict[str, Any]:
         """Check compliance for B.Ed. and M.Ed. programs"""
         
-        course_distribution = await self._analyze_teacher_education_distribution(schedule)
+        course_distribution = self._analyze_teacher_education_distribution(schedule)
         
         for category, min_percentage in self.teacher_education_requirements.items():
             current_percentage = course_distribution.get(category, 0)
             
             is_compliant = current_percentage >= min_percentage
+            tally.compliant_categories += is_compliant
+            tally.total_categories += 1
             
-            report['category_compliance'][category] = {
-                'compliant': is_compliant,
-                'current_percentage': current_percentage,
-                'minimum_percentage': min_percentage
-            }
+            if verbose:
+                report['category_compliance'][category] = {
+                    'compliant': is_compliant,
+                    'current_percentage': current_percentage,
+                    'minimum_percentage': min_percentage
+                }
             
             if not is_compliant:
                 report['overall_compliant'] = False
-                report['violations'].append(
-                    f"{category.title()} component is below minimum "
-                    f"({current_percentage:.1f}% < {min_percentage}%)"
-                )
-                report['recommendations'].append(
-                    f"Increase {category} courses by {min_percentage - current_percentage:.1f}%"
-                )
+                tally.violations += 1
+                if verbose:
+                    report['violations'].append(
+                        f"{category.title()} component is below minimum "
+                        f"({current_percentage:.1f}% < {min_percentage}%)"
+                    )
+                    report['recommendations'].append(
+                        f"Increase {category} courses by {min_percentage - current_percentage:.1f}%"
+                    )
         
         # Check teaching practice hours
         practicum_hours = course_distribution.get('practicum_hours', 0)
         if practicum_hours < 100:  # Minimum 100 hours of teaching practice
-            report['violations'].append(
-                f"Teaching practice hours insufficient ({practicum_hours} < 100 hours)"
-            )
-            report['recommendations'].append(
-                f"Add {100 - practicum_hours} more hours of teaching practice"
-            )
+            tally.violations += 1
+            if verbose:
+                report['violations'].append(
+                    f"Teaching practice hours insufficient ({practicum_hours} < 100 hours)"
+                )
+                report['recommendations'].append(
+                    f"Add {100 - practicum_hours} more hours of teaching practice"
+                )
         
         return report
     
-    async def _analyze_course_distribution(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze distribution of courses across NEP categories"""
+    def _aggregate(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect per-category credits, disciplines and hour totals in one pass over the subjects"""
         
-        distribution = {}
+        category_of = self._category_index.get
+        classify = _classify_type
+        category_credits = [0] * len(self._category_index)
         total_credits = 0
+        disciplines = set()
+        add_discipline = disciplines.add
+        theory_hours = 0
+        practical_hours = 0
+        internship_hours = 0
+        
+        # Loop-invariant lookups are bound to locals above; each subject's
+        # get method is bound once per subject
+        for subject in schedule.get('subjects', []):
+            get = subject.get
+            subject_type, is_internship = classify(get('type', ''))
+            
+            # Credits by category
+            idx = category_of(subject_type)
+            if idx is not None:
+                credits = get('credits', 3)
+                category_credits[idx] += credits
+                total_credits += credits
+            
+            # Unique departments/disciplines
+            add_discipline(get('department', 'general'))
+            
+            # Theory, practical and internship/project hours
+            theory_hours += get('theory_hours', 0)
+            practical_hours += get('practical_hours', 0)
+            if is_internship:
+                internship_hours += get('hours', 0)
         
-        # Count courses and credits by category
-        category_counts = {
-            'major': {'courses': 0, 'credits': 0},
-            'minor': {'courses': 0, 'credits': 0},
-            'skill': {'courses': 0, 'credits': 0},
-            'ability_enhancement': {'courses': 0, 'credits': 0},
-            'value_added': {'courses': 0, 'credits': 0}
+        return {
+            'category_credits': category_credits,
+            'total_credits': total_credits,
+            'disciplines': disciplines,
+            'theory_hours': theory_hours,
+            'practical_hours': practical_hours,
+            'internship_hours': internship_hours
         }
+    
+    def _analyze_course_distribution(self, aggregate: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Percentage and credits of each NEP category, in requirement order"""
         
-        # Parse subjects from schedule
-        subjects = schedule.get('subjects', [])
-        
-        for subject in subjects:
-            subject_type = subject.get('type', '').lower()
-            credits = subject.get('credits', 3)
-            
-            if subject_type in category_counts:
-                category_counts[subject_type]['courses'] += 1
-                category_counts[subject_type]['credits'] += credits
-                total_credits += credits
+        credits = np.array(aggregate['category_credits'], dtype=np.int64)
+        total_credits = aggregate['total_credits']
         
         # Calculate percentages
-        for category, data in category_counts.items():
-            percentage = (data['credits'] / total_credits * 100) if total_credits > 0 else 0
-            distribution[category] = {
-                'courses': data['courses'],
-                'credits': data['credits'],
-                'percentage': percentage
-            }
+        if total_credits > 0:
+            percentages = credits / total_credits * 100
+        else:
+            percentages = np.zeros(len(credits))
         
-        return distribution
+        return percentages, credits
     
-    async def _analyze_teacher_education_distribution(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_teacher_education_distribution(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze distribution for teacher education programs"""
         
-        distribution = {
-            'pedagogy': 0,
-            'subject_knowledge': 0,
-            'practicum': 0,
-            'electives': 0,
-            'practicum_hours': 0
-        }
+        # One counter per teacher-education component, plus practicum hours
+        distribution = dict.fromkeys((*self.teacher_education_requirements, 'practicum_hours'), 0)
         
         subjects = schedule.get('subjects', [])
         total_courses = len(subjects)
@@ -273,67 +389,36 @@ class NEPComplianceChecker:
         if total_courses == 0:
             return distribution
         
-        for subject in subjects:
-            subject_type = subject.get('type', '').lower()
-            
-            if 'pedagogy' in subject_type or 'teaching' in subject_type:
-                distribution['pedagogy'] += 1
-            elif 'practical' in subject_type or 'practicum' in subject_type:
-                distribution['practicum'] += 1
-                distribution['practicum_hours'] += subject.get('practical_hours', 20)
-            elif 'elective' in subject_type:
-                distribution['electives'] += 1
-            else:
-                distribution['subject_knowledge'] += 1
+        # Label every subject once, then count the labels
+        labels = [_classify_teacher_education_type(subject.get('type', '')) for subject in subjects]
+        counts = Counter(labels)
+        distribution['practicum_hours'] = sum(
+            subject.get('practical_hours', 20)
+            for subject, label in zip(subjects, labels)
+            if label == 'practicum'
+        )
         
         # Convert to percentages
-        for key in ['pedagogy', 'subject_knowledge', 'practicum', 'electives']:
-            distribution[key] = (distribution[key] / total_courses * 100)
+        for key in self.teacher_education_requirements:
+            distribution[key] = (counts[key] / total_courses * 100)
         
         return distribution
     
-    async def _calculate_multidisciplinary_score(self, schedule: Dict[str, Any]) -> float:
+    def _calculate_multidisciplinary_score(self, disciplines: Set[str]) -> float:
         """Calculate multidisciplinary exposure score"""
         
-        subjects = schedule.get('subjects', [])
-        
-        if not subjects:
-            return 0
-        
-        # Count unique departments/disciplines
-        disciplines = set()
-        for subject in subjects:
-            department = subject.get('department', 'general')
-            disciplines.add(department)
-        
         # More disciplines = higher multidisciplinary score
         # Normalized score: 3+ disciplines = 100%, 2 = 70%, 1 = 40%
-        if len(disciplines) >= 3:
-            return 100
-        elif len(disciplines) == 2:
-            return 70
-        elif len(disciplines) == 1:
-            return 40
-        
-        return 0
+        return _MULTIDISC_SCORES[min(len(disciplines), 3)]
     
-    async def _check_theory_practical_balance(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_theory_practical_balance(
+        self,
+        total_theory_hours: int,
+        total_practical_hours: int,
+        total_internship_hours: int
+    ) -> Dict[str, Any]:
         """Check theory-practical balance in curriculum"""
         
-        subjects = schedule.get('subjects', [])
-        
-        total_theory_hours = 0
-        total_practical_hours = 0
-        total_internship_hours = 0
-        
-        for subject in subjects:
-            total_theory_hours += subject.get('theory_hours', 0)
-            total_practical_hours += subject.get('practical_hours', 0)
-            
-            # Check for internship/project components
-            if 'internship' in subject.get('type', '').lower():
-                total_internship_hours += subject.get('hours', 0)
-        
         total_hours = total_theory_hours + total_practical_hours + total_internship_hours
         
         if total_hours == 0:
@@ -353,68 +438,64 @@ class NEPComplianceChecker:
             'total_hours': total_hours
         }
     
-    def _calculate_overall_score(self, report: Dict[str, Any]) -> float:
+    def _calculate_overall_score(self, tally: ComplianceTally, multidisciplinary_score: float) -> float:
         """Calculate overall compliance score"""
         
-        compliant_categories = sum(
-            1 for cat in report['category_compliance'].values() 
-            if cat.get('compliant', False)
-        )
-        
-        total_categories = len(report['category_compliance'])
-        
-        if total_categories == 0:
+        if tally.total_categories == 0:
             return 0
         
-        base_score = (compliant_categories / total_categories) * 100
+        base_score = (tally.compliant_categories / tally.total_categories) * 100
         
         # Bonus for multidisciplinary score
-        multidisciplinary_bonus = report.get('multidisciplinary_score', 0) * 0.1
+        multidisciplinary_bonus = multidisciplinary_score * 0.1
         
         # Penalty for violations
-        violation_penalty = len(report.get('violations', [])) * 5
+        violation_penalty = tally.violations * 5
         
-        final_score = min(100, max(0, base_score + multidisciplinary_bonus - violation_penalty))
+        final_score = min(100.0, max(0.0, base_score + multidisciplinary_bonus - violation_penalty))
         
-        return round(final_score, 2)
+        # Scores are never negative, so this rounds half up to 2 decimals
+        return int(final_score * 100 + 0.5) / 100
     
     def generate_compliance_summary(self, compliance_report: Dict[str, Any]) -> str:
         """Generate human-readable compliance summary"""
         
-        summary = f"NEP 2020 Compliance Report\n"
-        summary += f"{'=' * 50}\n\n"
-        
-        summary += f"Overall Compliance: {'✓ COMPLIANT' if compliance_report['overall_compliant'] else '✗ NON-COMPLIANT'}\n"
-        summary += f"Compliance Score: {compliance_report['compliance_score']:.1f}%\n"
-        summary += f"Multidisciplinary Score: {compliance_report.get('multidisciplinary_score', 0):.1f}%\n\n"
-        
-        summary += "Category-wise Compliance:\n"
-        summary += "-" * 50 + "\n"
-        
-        for category, data in compliance_report['category_compliance'].items():
-            status = "✓" if data['compliant'] else "✗"
-            summary += f"{status} {category.title()}: {data.get('current_percentage', 0):.1f}% "
-            summary += f"(Required: {data.get('required_range', 'N/A')})\n"
+        parts = [
+            "NEP 2020 Compliance Report\n",
+            f"{'=' * 50}\n\n",
+            f"Overall Compliance: {'✓ COMPLIANT' if compliance_report['overall_compliant'] else '✗ NON-COMPLIANT'}\n",
+            f"Compliance Score: {compliance_report['compliance_score']:.1f}%\n",
+            f"Multidisciplinary Score: {compliance_report.get('multidisciplinary_score', 0):.1f}%\n\n",
+            "Category-wise Compliance:\n",
+            "-" * 50 + "\n"
+        ]
+        
+        parts.extend(
+            f"{'✓' if data['compliant'] else '✗'} {category.title()}: {data.get('current_percentage', 0):.1f}% "
+            f"(Required: {data.get('required_range', 'N/A')})\n"
+            for category, data in compliance_report['category_compliance'].items()
+        )
         
         if compliance_report.get('violations'):
-            summary += f"\nViolations ({len(compliance_report['violations'])}):\n"
-            summary += "-" * 50 + "\n"
-            for i, violation in enumerate(compliance_report['violations'], 1):
-                summary += f"{i}. {violation}\n"
+            parts.append(f"\nViolations ({len(compliance_report['violations'])}):\n")
+            parts.append("-" * 50 + "\n")
+            parts.extend(f"{i}. {violation}\n" for i, violation in enumerate(compliance_report['violations'], 1))
         
         if compliance_report.get('recommendations'):
-            summary += f"\nRecommendations:\n"
-            summary += "-" * 50 + "\n"
-            for i, recommendation in enumerate(compliance_report['recommendations'], 1):
-                summary += f"{i}. {recommendation}\n"
+            parts.append("\nRecommendations:\n")
+            parts.append("-" * 50 + "\n")
+            parts.extend(
+                f"{i}. {recommendation}\n"
+                for i, recommendation in enumerate(compliance_report['recommendations'], 1)
+            )
         
         # Credit distribution
         if compliance_report.get('credit_distribution'):
-            summary += f"\nCredit Distribution:\n"
-            summary += "-" * 50 + "\n"
             dist = compliance_report['credit_distribution']
-            summary += f"Theory: {dist.get('theory_percentage', 0):.1f}%\n"
-            summary += f"Practical: {dist.get('practical_percentage', 0):.1f}%\n"
-            summary += f"Internship: {dist.get('internship_percentage', 0):.1f}%\n"
+            parts.append("\nCredit Distribution:\n")
+            parts.append("-" * 50 + "\n")
+            parts.append(f"Theory: {dist.get('theory_percentage', 0):.1f}%\n")
+            parts.append(f"Practical: {dist.get('practical_percentage', 0):.1f}%\n")
+            parts.append(f"Internship: {dist.get('internship_percentage', 0):.1f}%\n")
         
-        return summary
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file